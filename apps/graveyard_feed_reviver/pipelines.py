@@ -5,19 +5,91 @@ This module defines all the steps needed to resurrect old feeds, normalize their
 entries, and output them as JSON and markdown grimoires.
 """
 
+import hashlib
 import json
 import logging
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Optional
 
 import feedparser
 import requests
+from requests.adapters import HTTPAdapter
 
+from skeleton_core.cache import CACHE_DIR
 from skeleton_core.config import register_step
+from skeleton_core.steps.data_ops import _orjson_matches_json
 from skeleton_core.summarization import summarize_feeds
 from skeleton_core.utils import validate_file_path
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Buffer size for report writers, large enough that typical outputs hit disk in one write
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+class FeedCache:
+    """
+    On-disk cache of extracted feed entries, keyed by feed URL.
+    
+    Each feed is stored as a small JSON file holding its entries together with
+    the ETag and Last-Modified validators from the response that produced them,
+    so unchanged feeds can be revalidated with a conditional request.
+    """
+    
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize the feed cache.
+        
+        Args:
+            cache_dir: Directory for cache files (defaults to .bonesaw_cache/feeds)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR / "feeds"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _path(self, url: str) -> Path:
+        """Return the cache file path for a feed URL."""
+        return self.cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+    
+    def load(self, url: str) -> Optional[dict[str, Any]]:
+        """
+        Load the cached record for a feed.
+        
+        Returns:
+            Dict with 'etag', 'last_modified' and 'entries', or None if not cached
+        """
+        path = self._path(url)
+        if not path.exists():
+            return None
+        
+        try:
+            return json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable feed cache for {url}: {e}")
+            return None
+    
+    def save(
+        self,
+        url: str,
+        entries: list[dict[str, Any]],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """Store the entries and validators for a feed."""
+        record = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'entries': entries
+        }
+        self._path(url).write_text(json.dumps(record, ensure_ascii=False), encoding='utf-8')
+
 
 @register_step("load_feed_urls")
 class LoadFeedURLsStep:
@@ -62,55 +134,144 @@ class FetchFeedsStep:
     """
     Fetch RSS/Atom feeds from URLs and extract entries.
     
+    Feed bodies are downloaded concurrently on a thread pool, since fetching is
+    dominated by network I/O, and parsed on the calling thread as they arrive.
+    All downloads share one keep-alive session, so feeds on the same host reuse
+    a connection (and its TLS handshake) and are transferred gzip-compressed.
+    Entries are returned in the order of the input URLs.
+    
+    When caching is enabled, previously seen feeds are requested with their
+    ETag/Last-Modified validators and a 304 response reuses the cached entries.
+    
     Input: list[str] of feed URLs
     Output: list[dict] of feed entries with metadata
-    Context: Writes 'feeds_fetched' and 'total_entries'
+    Context: Writes 'feeds_fetched', 'total_entries', 'feed_cache_hits' and
+        'feed_cache_misses'
     """
     
+    def __init__(self, max_workers: int = 8, use_cache: bool = True, cache_dir: Optional[str] = None):
+        """
+        Initialize the feed fetcher.
+        
+        Args:
+            max_workers: Maximum number of feeds fetched concurrently
+            use_cache: Revalidate feeds against the on-disk feed cache
+            cache_dir: Directory for the feed cache (defaults to .bonesaw_cache/feeds)
+        """
+        self.max_workers = max_workers
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
+    
     def run(self, data: Any, context: dict[str, Any]) -> list[dict[str, Any]]:
         """Fetch feeds and extract entries."""
         urls = data
-        all_entries = []
-        feeds_fetched = 0
+        results: list[list[dict[str, Any]] | None] = [None] * len(urls)
+        cache = FeedCache(self.cache_dir) if self.use_cache else None
+        cache_hits = 0
+        cache_misses = 0
         
         logger.info(f"Fetching {len(urls)} feeds")
         
-        for url in urls:
-            logger.info(f"Fetching feed: {url}")
-
-            try:
-                # Fetch with timeout to prevent hanging
-                response = requests.get(url, timeout=30)
-                response.raise_for_status()
-
-                # Parse the feed content
-                feed = feedparser.parse(response.content)
-
-                # Get feed-level metadata
-                feed_title = feed.feed.get('title', 'Unknown Feed')
-
-                # Extract entries
-                for entry in feed.entries:
-                    all_entries.append({
-                        'feed_title': feed_title,
-                        'entry_title': entry.get('title', 'Untitled'),
-                        'link': entry.get('link', ''),
-                        'published': entry.get('published', None),
-                        'summary': entry.get('summary', None)
-                    })
+        cached = [cache.load(url) if cache else None for url in urls]
+        
+        with self._session() as session, ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._download, session, url, cached[i]): i
+                for i, url in enumerate(urls)
+            }
+            
+            for future in as_completed(futures):
+                index = futures[future]
+                url = urls[index]
                 
+                try:
+                    response = future.result()
+                    
+                    # Feed unchanged since it was cached - skip parsing entirely
+                    if response.status_code == 304 and cached[index] is not None:
+                        results[index] = cached[index]['entries']
+                        cache_hits += 1
+                        logger.info(f"Feed not modified, using {len(results[index])} cached entries: {url}")
+                        continue
+                    
+                    # Parse the feed content
+                    feed = feedparser.parse(response.content)
+                    
+                    # Get feed-level metadata
+                    feed_title = feed.feed.get('title', 'Unknown Feed')
+                    
+                    # Extract entries
+                    results[index] = [
+                        {
+                            'feed_title': feed_title,
+                            'entry_title': entry.get('title', 'Untitled'),
+                            'link': entry.get('link', ''),
+                            'published': entry.get('published', None),
+                            'summary': entry.get('summary', None)
+                        }
+                        for entry in feed.entries
+                    ]
+                    
+                    if cache:
+                        cache_misses += 1
+                        cache.save(
+                            url,
+                            results[index],
+                            etag=response.headers.get('ETag'),
+                            last_modified=response.headers.get('Last-Modified')
+                        )
+                    
+                    logger.info(f"Extracted {len(feed.entries)} entries from {feed_title}")
+                    
+                except Exception as e:
+                    logger.error(f"Failed to fetch feed {url}: {e}")
+        
+        # Keep output stable regardless of which fetch finished first
+        all_entries = []
+        feeds_fetched = 0
+        for feed_entries in results:
+            if feed_entries is not None:
+                all_entries.extend(feed_entries)
                 feeds_fetched += 1
-                logger.info(f"Extracted {len(feed.entries)} entries from {feed_title}")
-                
-            except Exception as e:
-                logger.error(f"Failed to fetch feed {url}: {e}")
         
         context['feeds_fetched'] = feeds_fetched
         context['total_entries'] = len(all_entries)
+        context['feed_cache_hits'] = cache_hits
+        context['feed_cache_misses'] = cache_misses
         
         logger.info(f"Fetched {feeds_fetched} feeds with {len(all_entries)} total entries")
         
         return all_entries
+    
+    def _session(self) -> requests.Session:
+        """Create an HTTP session with a connection pool sized for the worker threads."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=self.max_workers)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def _download(
+        self,
+        session: requests.Session,
+        url: str,
+        cached: Optional[dict[str, Any]] = None
+    ) -> requests.Response:
+        """Download a single feed, revalidating against its cached validators."""
+        logger.info(f"Fetching feed: {url}")
+        
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        # Fetch with timeout to prevent hanging
+        response = session.get(url, headers=headers, timeout=30)
+        response.raise_for_status()
+        
+        return response
 
 
 @register_step("normalize_entries")
@@ -118,33 +279,64 @@ class NormalizeEntriesStep:
     """
     Normalize feed entries to ensure consistent structure.
     
-    Ensures all entries have the required fields with proper defaults.
+    Ensures all entries have the required fields with proper defaults. Entries
+    that already have exactly those fields (as emitted by fetch_feeds) are
+    passed through without being copied.
     
-    Input: list[dict] of raw feed entries
+    Entries may also come from a lazy iterable (e.g. a generator from a custom
+    upstream step); they are then normalized as they are consumed, without
+    materializing the raw input first.
+    
+    Input: list[dict] (or any iterable of dicts) of raw feed entries
     Output: list[dict] of normalized entries
     Context: Writes 'normalized_count'
     """
     
+    FIELDS = frozenset({'feed_title', 'entry_title', 'link', 'published', 'summary'})
+    
     def run(self, data: Any, context: dict[str, Any]) -> list[dict[str, Any]]:
         """Normalize feed entries."""
         entries = data
         
+        if not isinstance(entries, list):
+            logger.info("Normalizing entries from a stream")
+            fields = self.FIELDS
+            normalized = [
+                entry if entry.keys() == fields else self._normalize(entry)
+                for entry in entries
+            ]
+            context['normalized_count'] = len(normalized)
+            logger.info(f"Normalized {len(normalized)} entries")
+            return normalized
+        
         logger.info(f"Normalizing {len(entries)} entries")
         
-        normalized = []
-        for entry in entries:
-            normalized.append({
-                'feed_title': entry.get('feed_title', 'Unknown Feed'),
-                'entry_title': entry.get('entry_title', 'Untitled'),
-                'link': entry.get('link', ''),
-                'published': entry.get('published', None),
-                'summary': entry.get('summary', None)
-            })
+        # Already well-formed - rebuilding every dict would change nothing
+        if all(entry.keys() == self.FIELDS for entry in entries):
+            context['normalized_count'] = len(entries)
+            logger.info(f"All {len(entries)} entries already normalized")
+            return entries
+        
+        # One output per input, so size the list up front instead of growing it
+        normalized = [None] * len(entries)
+        for i, entry in enumerate(entries):
+            normalized[i] = self._normalize(entry)
         
         context['normalized_count'] = len(normalized)
         logger.info(f"Normalized {len(normalized)} entries")
         
         return normalized
+    
+    @staticmethod
+    def _normalize(entry: dict[str, Any]) -> dict[str, Any]:
+        """Build an entry with every required field, filling in defaults."""
+        return {
+            'feed_title': entry.get('feed_title', 'Unknown Feed'),
+            'entry_title': entry.get('entry_title', 'Untitled'),
+            'link': entry.get('link', ''),
+            'published': entry.get('published', None),
+            'summary': entry.get('summary', None)
+        }
 
 
 @register_step("write_json")
@@ -172,8 +364,23 @@ class WriteJSONStep:
         
         logger.info(f"Writing {len(entries)} entries to JSON: {self.output_path}")
         
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            json.dump(entries, f, indent=2, ensure_ascii=False)
+        # Encode once and write once - json.dump would issue a write per token.
+        # orjson is only used when it would write exactly what the stdlib
+        # encoder does (plain JSON values, no NaN or exponent floats); anything
+        # else, including values orjson rejects, goes through json.
+        # An empty list encodes to "[]" with either, so skip the encoder.
+        payload = None
+        if not entries:
+            payload = b"[]"
+        elif orjson is not None and _orjson_matches_json(entries):
+            try:
+                payload = orjson.dumps(entries, option=orjson.OPT_INDENT_2)
+            except TypeError:
+                pass
+        if payload is None:
+            payload = json.dumps(entries, indent=2, ensure_ascii=False).encode('utf-8')
+        with open(self.output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(payload)
         
         context['json_path'] = self.output_path
         logger.info("JSON file written successfully")
@@ -186,6 +393,8 @@ class WriteMarkdownStep:
     """
     Generate a markdown grimoire from feed entries.
     
+    Entries are grouped into one section per feed, with feeds in title order.
+    
     Input: list[dict] of normalized entries
     Output: Same list (pass-through)
     Context: Writes 'markdown_path' with output file path
@@ -206,52 +415,46 @@ class WriteMarkdownStep:
         
         logger.info(f"Writing {len(entries)} entries to markdown: {self.output_path}")
         
-        lines = [
-            "# ☠️ Graveyard Feed Reviver",
-            "",
-            f"Resurrected {len(entries)} entries from the digital graveyard.",
-            ""
-        ]
+        # Group entries by feed for better organization. The sort is stable,
+        # so entries keep their original order within each feed.
+        by_feed_title = itemgetter('feed_title')
+        sorted_entries = sorted(entries, key=by_feed_title)
         
-        # Group entries by feed for better organization
-        by_feed: dict[str, list[dict[str, Any]]] = {}
-        for entry in entries:
-            feed_title = entry['feed_title']
-            if feed_title not in by_feed:
-                by_feed[feed_title] = []
-            by_feed[feed_title].append(entry)
+        # Build the whole document as a list of parts and hand it to the
+        # file in a single write. Each block starts with its blank separator line.
+        parts = [
+            "# ☠️ Graveyard Feed Reviver\n\n",
+            f"Resurrected {len(entries)} entries from the digital graveyard.\n",
+        ]
+        append = parts.append
         
         # Write entries grouped by feed
-        for feed_title, feed_entries in by_feed.items():
-            lines.append(f"## 📡 {feed_title}")
-            lines.append("")
+        for feed_title, feed_entries in groupby(sorted_entries, key=by_feed_title):
+            append(f"\n## 📡 {feed_title}\n")
             
+            # One template per entry, with optional blocks pre-rendered
             for entry in feed_entries:
-                lines.append(f"### 🧟 {entry['entry_title']}")
-                lines.append("")
-                
-                if entry['link']:
-                    lines.append(f"**Link:** {entry['link']}")
-                    lines.append("")
-                
-                if entry['published']:
-                    lines.append(f"**Published:** {entry['published']}")
-                    lines.append("")
+                link = entry['link']
+                published = entry['published']
+                summary = entry['summary']
                 
-                if entry['summary']:
+                link_block = f"\n**Link:** {link}\n" if link else ""
+                published_block = f"\n**Published:** {published}\n" if published else ""
+                if summary:
                     # Truncate long summaries
-                    summary = entry['summary']
                     if len(summary) > 300:
                         summary = summary[:297] + "..."
-                    lines.append(f"{summary}")
-                    lines.append("")
+                    summary_block = f"\n{summary}\n"
+                else:
+                    summary_block = ""
                 
-                lines.append("---")
-                lines.append("")
+                append(
+                    f"\n### 🧟 {entry['entry_title']}\n"
+                    f"{link_block}{published_block}{summary_block}\n---\n"
+                )
         
-        # Write to file
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+        with open(self.output_path, 'wb') as f:
+            f.write("".join(parts).encode('utf-8'))
         
         context['markdown_path'] = self.output_path
         logger.info("Markdown grimoire written successfully")
@@ -291,10 +494,8 @@ class FeedLLMSummaryStep:
         summary_text = summarize_feeds(entries, context)
         
         # Append to the existing markdown file
-        with open(self.output_path, 'a', encoding='utf-8') as f:
-            f.write("\n## 🧙 Necromancer's Overview\n\n")
-            f.write(summary_text)
-            f.write("\n")
+        with open(self.output_path, 'ab', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(f"\n## 🧙 Necromancer's Overview\n\n{summary_text}\n".encode())
         
         context['llm_overview'] = summary_text
         logger.info("Summary appended to grimoire")
@@ -6,23 +6,51 @@ anonymize sensitive data, aggregate statistics, and generate reports.
 """
 
 import logging
+import mmap
+import os
 import re
-from typing import Any
+from collections import Counter
+from collections.abc import Iterator
+from typing import Any, Optional
 
 from skeleton_core.config import register_step
 from skeleton_core.summarization import summarize_logs
 from skeleton_core.utils import validate_file_path
 
+try:
+    import re2
+except ImportError:  # optional: linear-time redaction for AnonymizeLogsStep
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
+# Buffer size for report writers, large enough that typical outputs hit disk in one write
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _is_buffer(data: Any) -> bool:
+    """Check whether step input is a raw log buffer rather than a list of lines."""
+    return isinstance(data, (bytes, bytearray, memoryview, mmap.mmap))
+
+
+def _describe_input(data: Any) -> str:
+    """Describe raw log input for progress messages."""
+    if _is_buffer(data):
+        return f"{len(data)} bytes of logs"
+    return f"{len(data)} log lines"
+
 
 @register_step("load_logs")
 class LoadLogsStep:
     """
-    Load log file contents into memory.
+    Memory-map a log file for parsing.
+    
+    The file is mapped read-only rather than read into a list of decoded lines,
+    so pages are served straight from the OS cache and only the fields of
+    successfully parsed lines are ever decoded.
     
     Input: None (or ignored)
-    Output: list[str] of raw log lines
+    Output: Bytes-like buffer with the raw log file contents
     Context: Writes 'source_file' with the path that was loaded
     """
     
@@ -35,29 +63,37 @@ class LoadLogsStep:
         """
         self.path = path
     
-    def run(self, data: Any, context: dict[str, Any]) -> list[str]:
-        """Load log file and return lines."""
+    def run(self, data: Any, context: dict[str, Any]) -> mmap.mmap | bytes:
+        """Map the log file into memory."""
         validated_path = validate_file_path(self.path)
         logger.info(f"Loading logs from {validated_path}")
 
-        with open(validated_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        with open(validated_path, 'rb') as f:
+            # Empty files cannot be mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                contents = b""
+            else:
+                contents = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
         context['source_file'] = str(validated_path)
-        logger.info(f"Loaded {len(lines)} log lines")
+        logger.info(f"Loaded {len(contents)} bytes of logs")
         
-        return lines
+        return contents
 
 
 @register_step("parse_logs")
 class ParseLogsStep:
     """
-    Parse raw log lines into structured dictionaries.
+    Parse raw log lines into parallel columns.
     
     Expected format: YYYY-MM-DD HH:MM:SS [LEVEL] message text
     
-    Input: list[str] of raw log lines
-    Output: list[dict] with keys: timestamp, level, message
+    Logs are stored column-wise (one list per field) rather than as one dict
+    per entry, which avoids a dict per line and lets later steps work on a
+    single field at a time.
+    
+    Input: Bytes-like buffer of raw log text (from load_logs), or list[str] of lines
+    Output: dict with parallel lists: 'timestamps', 'levels', 'messages'
     Context: Writes 'parsed_count' and 'skipped_count'
     """
     
@@ -66,36 +102,75 @@ class ParseLogsStep:
         r'^(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+\[(\w+)\]\s+(.+)$'
     )
     
-    def run(self, data: Any, context: dict[str, Any]) -> list[dict[str, str]]:
+    # The same format applied to a whole buffer in one scan. Any other non-blank
+    # line matches the second branch (with no groups set) so it can be counted
+    # as skipped; blank lines do not match at all.
+    BUFFER_PATTERN = re.compile(
+        rb'^[ \t]*(?:(\d{4}-\d{2}-\d{2}[ \t]+\d{2}:\d{2}:\d{2})[ \t]+\[(\w+)\][ \t]+(.*\S)|\S.*)[ \t\r]*$',
+        re.MULTILINE
+    )
+    
+    def run(self, data: Any, context: dict[str, Any]) -> dict[str, list[str]]:
         """Parse log lines into structured format."""
-        lines = data
-        parsed_logs = []
+        timestamps: list[str] = []
+        levels: list[str] = []
+        messages: list[str] = []
         skipped = 0
         
-        logger.info(f"Parsing {len(lines)} log lines")
+        logger.info(f"Parsing {_describe_input(data)}")
+        
+        for record in self.iter_records(data):
+            if record is None:
+                skipped += 1
+                continue
+            
+            timestamp, level, message = record
+            timestamps.append(timestamp)
+            levels.append(level)
+            messages.append(message)
+        
+        context['parsed_count'] = len(messages)
+        context['skipped_count'] = skipped
         
-        for line in lines:
+        logger.info(f"Parsed {len(messages)} logs, skipped {skipped}")
+        
+        return {'timestamps': timestamps, 'levels': levels, 'messages': messages}
+    
+    @classmethod
+    def iter_records(cls, data: Any) -> Iterator[Optional[tuple[str, str, str]]]:
+        """
+        Yield (timestamp, level, message) for every non-blank log line.
+        
+        Lines that don't match the expected format yield None. Bytes-like input
+        is scanned in one pass and only the fields of matched lines are decoded.
+        """
+        # Checked once up front so skipped lines cost nothing when DEBUG is off
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        if _is_buffer(data):
+            for match in cls.BUFFER_PATTERN.finditer(data):
+                timestamp, level, message = match.groups()
+                if timestamp is None:
+                    if debug:
+                        logger.debug("Skipped unparseable line: %r", match.group()[:50])
+                    yield None
+                else:
+                    yield timestamp.decode(), level.decode(), message.decode('utf-8', errors='replace')
+            return
+        
+        match_line = cls.LOG_PATTERN.match
+        for line in data:
             line = line.strip()
             if not line:
                 continue
                 
-            match = self.LOG_PATTERN.match(line)
+            match = match_line(line)
             if match:
-                parsed_logs.append({
-                    'timestamp': match.group(1),
-                    'level': match.group(2),
-                    'message': match.group(3)
-                })
+                yield match.group(1), match.group(2), match.group(3)
             else:
-                skipped += 1
-                logger.debug(f"Skipped unparseable line: {line[:50]}")
-        
-        context['parsed_count'] = len(parsed_logs)
-        context['skipped_count'] = skipped
-        
-        logger.info(f"Parsed {len(parsed_logs)} logs, skipped {skipped}")
-        
-        return parsed_logs
+                if debug:
+                    logger.debug("Skipped unparseable line: %s", line[:50])
+                yield None
 
 
 @register_step("anonymize_logs")
@@ -105,34 +180,63 @@ class AnonymizeLogsStep:
     
     Replaces email addresses and IPv4 addresses with [REDACTED].
     
-    Input: list[dict] of parsed logs
-    Output: list[dict] with anonymized messages
+    Input: dict of parsed log columns (from parse_logs)
+    Output: Same columns with anonymized 'messages'
     Context: Writes 'anonymized_count' with number of redactions
     """
     
-    EMAIL_PATTERN = re.compile(r'\S+@\S+')
-    IPV4_PATTERN = re.compile(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b')
+    # Emails and IPv4 addresses in one alternation, so each message is scanned once.
+    # The email branch may only start at a token boundary: otherwise a long token
+    # without an '@' is re-scanned from every offset, which is quadratic.
+    REDACT_PATTERN = re.compile(r'(?:(?<!\S)\S+@\S+|\b\d{1,3}(?:\.\d{1,3}){3}\b)')
+    
+    # RE2 has no lookbehind and doesn't need the boundary guard: it never
+    # backtracks, and a greedy \S+ match always runs to the end of its token.
+    # Note that RE2's \d only matches ASCII digits.
+    RE2_REDACT_PATTERN = r'(?:\S+@\S+|\b\d{1,3}(?:\.\d{1,3}){3}\b)'
+    
+    def __init__(self, use_re2: bool = False):
+        """
+        Initialize the anonymizer.
+        
+        Args:
+            use_re2: Redact with Google RE2 (the optional google-re2 package),
+                which matches in guaranteed linear time. Falls back to the
+                re module when the package is not installed.
+        """
+        self.use_re2 = use_re2
+        self._redact = self._compile(use_re2).subn
     
-    def run(self, data: Any, context: dict[str, Any]) -> list[dict[str, str]]:
+    @classmethod
+    def _compile(cls, use_re2: bool) -> Any:
+        """Pick the RE2 pattern when requested and available, otherwise the re one."""
+        if use_re2:
+            if re2 is None:
+                logger.warning("use_re2 set but google-re2 is not installed; using the re module")
+            else:
+                return re2.compile(cls.RE2_REDACT_PATTERN)
+        return cls.REDACT_PATTERN
+    
+    def run(self, data: Any, context: dict[str, Any]) -> dict[str, list[str]]:
         """Anonymize sensitive data in log messages."""
         logs = data
+        messages = logs['messages']
+        redact = self._redact
         redaction_count = 0
         
-        logger.info(f"Anonymizing {len(logs)} log entries")
+        logger.info(f"Anonymizing {len(messages)} log entries")
         
-        for log_entry in logs:
-            original_message = log_entry['message']
-            
-            # Replace emails
-            message = self.EMAIL_PATTERN.sub('[REDACTED]', original_message)
+        for i, message in enumerate(messages):
+            # Every email contains '@' and every IPv4 address a '.', so
+            # messages with neither skip the regex scan entirely
+            if '@' not in message and '.' not in message:
+                continue
             
-            # Replace IP addresses
-            message = self.IPV4_PATTERN.sub('[REDACTED]', message)
+            message, replaced = redact('[REDACTED]', message)
             
-            if message != original_message:
+            if replaced:
                 redaction_count += 1
-            
-            log_entry['message'] = message
+                messages[i] = message
         
         context['anonymized_count'] = redaction_count
         logger.info(f"Anonymized {redaction_count} log entries")
@@ -145,25 +249,23 @@ class AggregateErrorsStep:
     """
     Aggregate log statistics by level.
     
-    Input: list[dict] of parsed logs
-    Output: dict with 'total', 'by_level', and 'logs' keys
+    Input: dict of parsed log columns
+    Output: dict with 'total', 'by_level', and 'logs' (the columns) keys
     Context: Writes 'error_count' with number of ERROR-level logs
     """
     
     def run(self, data: Any, context: dict[str, Any]) -> dict[str, Any]:
         """Compute statistics from parsed logs."""
         logs = data
+        levels = logs['levels']
         
-        logger.info(f"Aggregating statistics for {len(logs)} logs")
+        logger.info(f"Aggregating statistics for {len(levels)} logs")
         
         # Count by level
-        by_level: dict[str, int] = {}
-        for log_entry in logs:
-            level = log_entry['level']
-            by_level[level] = by_level.get(level, 0) + 1
+        by_level = dict(Counter(levels))
         
         result = {
-            'total': len(logs),
+            'total': len(levels),
             'by_level': by_level,
             'logs': logs
         }
@@ -175,6 +277,68 @@ class AggregateErrorsStep:
         return result
 
 
+@register_step("process_logs")
+class ProcessLogsStep:
+    """
+    Parse, anonymize, and aggregate logs in a single pass.
+    
+    Equivalent to parse_logs -> anonymize_logs -> aggregate_errors, but each
+    line is matched, redacted, and counted as it is read instead of walking
+    the full list of entries three times.
+    
+    Input: Bytes-like buffer of raw log text (from load_logs), or list[str] of lines
+    Output: dict with 'total', 'by_level', and 'logs' (the columns) keys
+    Context: Writes 'parsed_count', 'skipped_count', 'anonymized_count', and 'error_count'
+    """
+    
+    def run(self, data: Any, context: dict[str, Any]) -> dict[str, Any]:
+        """Parse, anonymize, and aggregate logs."""
+        redact = AnonymizeLogsStep.REDACT_PATTERN.subn
+        timestamps: list[str] = []
+        levels: list[str] = []
+        messages: list[str] = []
+        by_level: Counter[str] = Counter()
+        skipped = 0
+        redaction_count = 0
+        
+        logger.info(f"Processing {_describe_input(data)}")
+        
+        for record in ParseLogsStep.iter_records(data):
+            if record is None:
+                skipped += 1
+                continue
+            
+            timestamp, level, message = record
+            # Same quick reject as AnonymizeLogsStep
+            if '@' in message or '.' in message:
+                message, replaced = redact('[REDACTED]', message)
+                if replaced:
+                    redaction_count += 1
+            
+            timestamps.append(timestamp)
+            levels.append(level)
+            messages.append(message)
+            by_level[level] += 1
+        
+        result = {
+            'total': len(messages),
+            'by_level': dict(by_level),
+            'logs': {'timestamps': timestamps, 'levels': levels, 'messages': messages}
+        }
+        
+        context['parsed_count'] = len(messages)
+        context['skipped_count'] = skipped
+        context['anonymized_count'] = redaction_count
+        context['error_count'] = by_level['ERROR']
+        
+        logger.info(
+            f"Processed {len(messages)} logs (skipped {skipped}, anonymized {redaction_count}), "
+            f"{len(by_level)} levels"
+        )
+        
+        return result
+
+
 @register_step("write_markdown_report")
 class WriteMarkdownReportStep:
     """
@@ -200,39 +364,25 @@ class WriteMarkdownReportStep:
         
         logger.info(f"Writing markdown report to {self.output_path}")
         
-        # Build markdown content
-        lines = [
-            "# 🩸 Haunted Log Report",
-            "",
-            "## Summary",
-            "",
-            f"**Total log entries:** {stats['total']}",
-            "",
-            "## Counts by Level",
-            ""
-        ]
-        
-        # Add level counts as a table
-        lines.append("| Level | Count |")
-        lines.append("|-------|-------|")
-        for level in sorted(stats['by_level'].keys()):
-            count = stats['by_level'][level]
-            lines.append(f"| {level} | {count} |")
-        
-        lines.append("")
-        lines.append("## Sample Messages")
-        lines.append("")
-        
-        # Show up to 5 sample messages
-        sample_logs = stats['logs'][:5]
-        for log_entry in sample_logs:
-            lines.append(f"- **[{log_entry['level']}]** {log_entry['timestamp']}: {log_entry['message']}")
-        
-        lines.append("")
-        
-        # Write to file
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+        # Stream the report straight to a large write buffer instead of
+        # building a list of lines and joining it
+        with open(self.output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            write = f.write
+            write("# 🩸 Haunted Log Report\n\n## Summary\n\n".encode())
+            write(f"**Total log entries:** {stats['total']}\n\n".encode())
+            
+            # Add level counts as a table
+            by_level = stats['by_level']
+            table_rows = "".join(f"| {level} | {by_level[level]} |\n" for level in sorted(by_level))
+            write(f"## Counts by Level\n\n| Level | Count |\n|-------|-------|\n{table_rows}".encode())
+            
+            # Show up to 5 sample messages
+            logs = stats['logs']
+            samples = "".join(
+                f"- **[{level}]** {timestamp}: {message}\n"
+                for timestamp, level, message in zip(logs['timestamps'][:5], logs['levels'][:5], logs['messages'][:5])
+            )
+            write(f"\n## Sample Messages\n\n{samples}".encode())
         
         context['report_path'] = self.output_path
         logger.info("Report written successfully")
@@ -272,10 +422,8 @@ class LogLLMSummaryStep:
         summary_text = summarize_logs(stats, context)
         
         # Append to the existing report
-        with open(self.output_path, 'a', encoding='utf-8') as f:
-            f.write("\n## 🔮 AI Summary\n\n")
-            f.write(summary_text)
-            f.write("\n")
+        with open(self.output_path, 'ab', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(f"\n## 🔮 AI Summary\n\n{summary_text}\n".encode())
         
         context['llm_summary'] = summary_text
         logger.info("Summary appended to report")
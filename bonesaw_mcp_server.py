@@ -6,14 +6,22 @@ Bonesaw pipelines programmatically.
 """
 
 import importlib
+import inspect
 import logging
 import shutil
+import sys
 import time
+from functools import lru_cache
 from pathlib import Path
 
 from mcp.server.fastmcp import FastMCP
 
-from skeleton_core.config import build_pipeline_from_config, load_config
+from skeleton_core.config import (
+    STEP_REGISTRY,
+    build_pipeline_from_config,
+    load_config,
+    unregister_module_steps,
+)
 from skeleton_core.scaffold import generate_app_files
 # Import built-in steps to auto-register them
 import skeleton_core.steps  # noqa: F401
@@ -33,18 +41,39 @@ mcp = FastMCP(
 )
 
 
+# Apps whose pipelines module has already been imported in this process
+_IMPORTED: set[str] = set()
+
+
 def _get_repo_root() -> Path:
     """Get the repository root directory."""
     return Path(__file__).parent
 
 
-def _get_step_description(step) -> str:
-    """Extract first line of docstring from a step instance."""
-    docstring = step.__class__.__doc__
+def _import_app(app: str) -> None:
+    """Import an app's pipelines module to register its steps (once per process)."""
+    if app not in _IMPORTED:
+        importlib.import_module(f"apps.{app}.pipelines")
+        _IMPORTED.add(app)
+
+
+def _forget_app(app: str) -> None:
+    """Drop a deleted app's modules and steps so a recreated app is imported fresh."""
+    _IMPORTED.discard(app)
+    module_name = f"apps.{app}.pipelines"
+    unregister_module_steps(module_name)
+    sys.modules.pop(module_name, None)
+    sys.modules.pop(f"apps.{app}", None)
+    # The import system caches directory listings; a recreated app must be found again
+    importlib.invalidate_caches()
+
+
+@lru_cache(maxsize=None)
+def _describe_class(cls: type) -> str:
+    """Extract first non-empty line of a class docstring (cached per class)."""
+    docstring = inspect.getdoc(cls)
     if docstring:
-        lines = [line.strip() for line in docstring.split('\n') if line.strip()]
-        if lines:
-            return lines[0]
+        return docstring.partition('\n')[0].strip()
     return "No description provided."
 
 
@@ -124,27 +153,26 @@ def bonesaw_inspect_pipeline(app: str, config: str | None = None) -> dict:
     
     try:
         # Import app's pipelines module to register steps
-        module_name = f"apps.{app}.pipelines"
-        importlib.import_module(module_name)
+        _import_app(app)
         
         # Load config and build pipeline
         config_dict = load_config(str(config_path))
         pipeline = build_pipeline_from_config(config_dict)
         
+        # Reverse registry lookup, built once per call. A class registered under
+        # several names reports the first one.
+        step_types: dict[type, str] = {}
+        for name, cls in STEP_REGISTRY.items():
+            step_types.setdefault(cls, name)
+        
         # Extract step information
         steps = []
         for i, step in enumerate(pipeline.steps, start=1):
-            step_class = step.__class__.__name__
-            description = _get_step_description(step)
+            cls = type(step)
+            step_class = cls.__name__
+            description = _describe_class(cls)
             
-            # Try to find the step type from registry
-            # (This is a best-effort lookup)
-            step_type = "unknown"
-            from skeleton_core.config import STEP_REGISTRY
-            for name, cls in STEP_REGISTRY.items():
-                if cls == step.__class__:
-                    step_type = name
-                    break
+            step_type = step_types.get(cls, "unknown")
             
             steps.append({
                 "index": i,
@@ -209,8 +237,7 @@ def bonesaw_run_pipeline(
     
     try:
         # Import app's pipelines module to register steps
-        module_name = f"apps.{app}.pipelines"
-        importlib.import_module(module_name)
+        _import_app(app)
         
         # Load config and build pipeline
         config_dict = load_config(str(config_path))
@@ -334,6 +361,7 @@ def bonesaw_delete_app(app: str, force: bool = False) -> dict:
     try:
         # Delete the directory
         shutil.rmtree(target_dir)
+        _forget_app(app)
         
         return {
             "app": app,
@@ -356,7 +384,6 @@ if __name__ == "__main__":
 
     # Handle graceful shutdown
     import signal
-    import sys
 
     def signal_handler(sig, frame):
         """Handle shutdown gracefully."""
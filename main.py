@@ -5,8 +5,9 @@ Main entry point for the CLI application.
 """
 
 import logging
+import sys
 
-from skeleton_core.cli import app
+from skeleton_core.fast_cli import fast_main
 
 if __name__ == "__main__":
     # Configure logging
@@ -15,5 +16,11 @@ if __name__ == "__main__":
         format="%(levelname)s: %(message)s"
     )
     
+    # Answer simple read-only commands without loading Typer
+    exit_code = fast_main(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+    
     # Run the Typer CLI app
+    from skeleton_core.cli import app
     app()
@@ -4,21 +4,248 @@ Caching utilities for Bonesaw pipelines.
 Provides simple file-based caching for expensive operations.
 """
 
+import atexit
 import hashlib
-import json
+import io
 import logging
+import os
 import pickle
+import queue
+import random
+import threading
 import time
+from collections import OrderedDict
 from functools import wraps
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import xxhash
+except ImportError:  # optional: faster non-cryptographic cache keys
+    xxhash = None
+
 logger = logging.getLogger(__name__)
 
 # Default cache directory
 CACHE_DIR = Path(".bonesaw_cache")
 CACHE_DIR.mkdir(exist_ok=True)
 
+# Header tag for cache files that carry out-of-band pickle buffers
+_PICKLE_FORMAT = 'bonesaw-pickle5'
+
+# In-process memo of recently used cache files, so repeat lookups in one
+# process skip the filesystem. Maps cache key -> (created_at, serialized
+# result); results are kept serialized so every hit returns a fresh copy.
+_MEMO: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+_MEMO_MAX_ENTRIES = 128
+_MEMO_MAX_BYTES = 8 * 1024 * 1024  # larger results are only cached on disk
+
+# Sorted kwarg names per kwarg layout (names in insertion order). A step's
+# params almost always arrive in the same order, so sorting happens once.
+_SORTED_KWARG_NAMES: dict[tuple[str, ...], tuple[str, ...]] = {}
+_SORTED_KWARG_NAMES_MAX = 1024
+
+# Size limit for the cache directory. The background writer enforces it on
+# roughly one write in EVICTION_CHECK_RATE, which amortizes the directory scan.
+CACHE_LIMIT_MB = 1024
+EVICTION_CHECK_RATE = 0.01
+
+# Cache files are written by a background thread so a step returns as soon as
+# its result is serialized. flush_cache_writes() waits for pending writes.
+_WRITE_QUEUE: queue.Queue[tuple[Path, bytes]] = queue.Queue()
+_writer_thread: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+
+
+def _new_hasher():
+    """
+    Create the hash object used for cache keys.
+
+    Cache keys only need to be well distributed, not cryptographically strong,
+    so xxh3_64 is used when the xxhash package is installed. Otherwise SHA256,
+    which is hardware-accelerated on most CPUs, is the fastest stdlib choice.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_64()
+    return hashlib.sha256()
+
+
+def _hash_data(hasher, data: Any) -> None:
+    """
+    Feed a single value to a cache key hasher.
+
+    Strings are hashed as UTF-8, scalars by their repr, and contiguous
+    buffers (bytes, mmap, arrays) in place. Other objects are pickled, which
+    is several times faster than str() for large collections; str() remains
+    the fallback for objects that can't be pickled.
+
+    Args:
+        hasher: Hash object from _new_hasher()
+        data: Value to hash
+    """
+    if isinstance(data, str):
+        _hash_text(hasher, b's', data)
+        return
+
+    if data is None or isinstance(data, (bool, int, float)):
+        _hash_text(hasher, b'v', repr(data))
+        return
+
+    try:
+        view = memoryview(data)
+    except TypeError:
+        view = None
+
+    if view is not None:
+        with view:
+            if view.c_contiguous:
+                # Element format and shape distinguish equal bytes of different arrays
+                hasher.update(b'b')
+                hasher.update(repr((view.format, view.shape)).encode())
+                hasher.update(view.cast('B'))
+                return
+
+    try:
+        payload = pickle.dumps(data, protocol=5)
+    except Exception:
+        pass
+    else:
+        hasher.update(b'p%d:' % len(payload))
+        hasher.update(payload)
+        return
+
+    try:
+        data_repr = str(data)
+    except Exception:
+        data_repr = repr(data)
+    _hash_text(hasher, b'r', data_repr)
+
+
+def _hash_text(hasher, tag: bytes, text: str) -> None:
+    """Feed tagged, length-prefixed text to a cache key hasher."""
+    encoded = text.encode('utf-8', 'surrogatepass')
+    hasher.update(b'%s%d:' % (tag, len(encoded)))
+    hasher.update(encoded)
+
+
+def _dump_result(result: Any, f) -> None:
+    """
+    Write a step result to an open cache file.
+
+    Uses pickle protocol 5 with out-of-band buffers: large buffers (bytearrays,
+    numpy arrays) are written straight to the file instead of being copied
+    through the pickle stream. Layout is a small header pickle with the buffer
+    sizes, the raw buffers, then the main pickle.
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    payload = pickle.dumps(result, protocol=5, buffer_callback=buffers.append)
+    raws = [buffer.raw() for buffer in buffers]
+
+    pickle.dump((_PICKLE_FORMAT, [raw.nbytes for raw in raws]), f, protocol=5)
+    for raw in raws:
+        f.write(raw)
+    f.write(payload)
+
+
+def _load_result(f) -> Any:
+    """Read a step result written by _dump_result (or a plain pickle)."""
+    header = pickle.load(f)
+    if not (isinstance(header, tuple) and len(header) == 2 and header[0] == _PICKLE_FORMAT):
+        # Written before out-of-band buffers were used: the pickle is the result
+        return header
+
+    buffers = []
+    for size in header[1]:
+        buffer = bytearray(size)
+        if f.readinto(buffer) != size:
+            raise EOFError("Truncated cache file")
+        buffers.append(buffer)
+
+    return pickle.load(f, buffers=buffers)
+
+
+class PickleSerializer:
+    """Default cache serializer: pickle protocol 5 with out-of-band buffers."""
+
+    def dumps(self, result: Any) -> bytes:
+        """Serialize a step result to bytes."""
+        buffer = io.BytesIO()
+        _dump_result(result, buffer)
+        return buffer.getvalue()
+
+    def loads(self, blob: bytes) -> Any:
+        """Deserialize a step result from bytes."""
+        return _load_result(io.BytesIO(blob))
+
+
+# Serializer for cache payloads. Any object with dumps(obj) -> bytes and
+# loads(bytes) -> obj can be swapped in, e.g. a joblib or cloudpickle wrapper
+# for results dominated by numpy arrays or tensors.
+_SERIALIZER = PickleSerializer()
+
+
+def _remember(cache_key: str, created_at: float, blob: bytes) -> None:
+    """Add a serialized result to the in-process memo, evicting the oldest entries."""
+    if len(blob) > _MEMO_MAX_BYTES:
+        return
+    _MEMO[cache_key] = (created_at, blob)
+    _MEMO.move_to_end(cache_key)
+    while len(_MEMO) > _MEMO_MAX_ENTRIES:
+        _MEMO.popitem(last=False)
+
+
+def _write_cache_file(cache_file: Path, blob: bytes) -> None:
+    """
+    Write a cache file atomically, so readers never see a partial file.
+
+    The temp file name is unique per process and thread, so concurrent
+    writers of the same key never interleave; the last os.replace wins.
+    """
+    cache_file.parent.mkdir(exist_ok=True)
+    tmp_file = cache_file.with_suffix(f'.pkl.tmp.{os.getpid()}.{threading.get_ident()}')
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(blob)
+        os.replace(tmp_file, cache_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def _write_loop() -> None:
+    """Background writer: drain queued cache writes forever."""
+    while True:
+        cache_file, blob = _WRITE_QUEUE.get()
+        try:
+            _write_cache_file(cache_file, blob)
+            if random.random() < EVICTION_CHECK_RATE:
+                enforce_cache_limit(CACHE_LIMIT_MB)
+        except Exception as e:
+            logger.warning(f"Failed to cache result: {e}")
+        finally:
+            _WRITE_QUEUE.task_done()
+
+
+def _enqueue_write(cache_file: Path, blob: bytes) -> None:
+    """Queue a cache file write, starting the background writer if needed."""
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(
+                target=_write_loop, name="bonesaw-cache-writer", daemon=True
+            )
+            _writer_thread.start()
+    _WRITE_QUEUE.put((cache_file, blob))
+
+
+def flush_cache_writes() -> None:
+    """Block until every queued cache write has reached disk."""
+    _WRITE_QUEUE.join()
+
+
+# Don't lose queued results when the process exits
+atexit.register(flush_cache_writes)
+
 
 def get_cache_key(func_name: str, args: tuple, kwargs: dict) -> str:
     """
@@ -30,17 +257,29 @@ def get_cache_key(func_name: str, args: tuple, kwargs: dict) -> str:
         kwargs: Keyword arguments
 
     Returns:
-        SHA256 hash as hex string
+        Hash as hex string (16 chars with xxhash, 64 with SHA256)
     """
-    # Create a stable representation
-    key_data = {
-        'func': func_name,
-        'args': str(args),
-        'kwargs': str(sorted(kwargs.items()))
-    }
-
-    key_json = json.dumps(key_data, sort_keys=True)
-    return hashlib.sha256(key_json.encode()).hexdigest()
+    # Feed each field to the hasher as it is rendered instead of building and
+    # re-encoding one JSON document. NUL and ';' keep the fields unambiguous.
+    hasher = _new_hasher()
+    hasher.update(func_name.encode())
+    hasher.update(b'\x00')
+    for arg in args:
+        _hash_data(hasher, arg)
+        hasher.update(b'\x00')
+    names = tuple(kwargs)
+    sorted_names = _SORTED_KWARG_NAMES.get(names)
+    if sorted_names is None:
+        if len(_SORTED_KWARG_NAMES) >= _SORTED_KWARG_NAMES_MAX:
+            _SORTED_KWARG_NAMES.clear()
+        sorted_names = _SORTED_KWARG_NAMES[names] = tuple(sorted(names))
+
+    for key in sorted_names:
+        hasher.update(key.encode())
+        hasher.update(b'=')
+        hasher.update(repr(kwargs[key]).encode())
+        hasher.update(b';')
+    return hasher.hexdigest()
 
 
 def cache_step(ttl: int = 3600):
@@ -65,43 +304,79 @@ def cache_step(ttl: int = 3600):
         def cached_run(self, data: Any, context: dict[str, Any]) -> Any:
             # Generate cache key based on step class, data, and init params
             step_name = cls.__name__
-            init_params = {
-                k: v for k, v in self.__dict__.items()
-                if not k.startswith('_')
-            }
 
-            # Create a hashable representation of data
-            try:
-                data_repr = str(data)
-            except Exception:
-                data_repr = repr(data)
+            # Init params are fixed after construction, so fingerprint them
+            # once per instance rather than on every run
+            init_fingerprint = self.__dict__.get('_init_fingerprint')
+            if init_fingerprint is None:
+                init_params = {
+                    k: v for k, v in self.__dict__.items()
+                    if not k.startswith('_')
+                }
+                init_fingerprint = get_cache_key(step_name, (), init_params)
+                self._init_fingerprint = init_fingerprint
 
             cache_key = get_cache_key(
                 step_name,
-                (data_repr,),
-                init_params
+                (data, init_fingerprint),
+                {}
             )
 
-            cache_file = CACHE_DIR / f"{cache_key}.pkl"
+            # Shard by the first key byte so no directory grows too large
+            cache_file = CACHE_DIR / cache_key[:2] / f"{cache_key[2:]}.pkl"
 
-            # Check if cached result exists and is still valid
-            if cache_file.exists():
-                cache_age = time.time() - cache_file.stat().st_mtime
+            # Serve repeat lookups from memory before touching the filesystem
+            memo = _MEMO.get(cache_key)
+            if memo is not None:
+                created_at, blob = memo
+                cache_age = time.time() - created_at
 
                 if cache_age < ttl:
+                    _MEMO.move_to_end(cache_key)
                     logger.info(
-                        f"Cache HIT for {step_name} "
+                        f"Cache HIT for {step_name} from memory "
                         f"(age: {int(cache_age)}s, ttl: {ttl}s)"
                     )
 
-                    with open(cache_file, 'rb') as f:
-                        cached_result = pickle.load(f)
-
-                    # Add cache info to context
                     context['cache_hit'] = True
                     context['cache_age'] = cache_age
 
-                    return cached_result
+                    return _SERIALIZER.loads(blob)
+
+            # Check if cached result exists and is still valid
+            try:
+                created_at = cache_file.stat().st_mtime
+            except FileNotFoundError:
+                created_at = None
+
+            if created_at is not None:
+                cache_age = time.time() - created_at
+
+                if cache_age < ttl:
+                    try:
+                        with open(cache_file, 'rb') as f:
+                            blob = f.read()
+                        cached_result = _SERIALIZER.loads(blob)
+                    except FileNotFoundError:
+                        # Evicted between the stat and the open
+                        pass
+                    except Exception as e:
+                        # Unreadable file (e.g. torn by an older non-atomic writer):
+                        # drop it and recompute instead of failing every run
+                        logger.warning(f"Discarding unreadable cache file for {step_name}: {e}")
+                        cache_file.unlink(missing_ok=True)
+                    else:
+                        logger.info(
+                            f"Cache HIT for {step_name} "
+                            f"(age: {int(cache_age)}s, ttl: {ttl}s)"
+                        )
+                        _remember(cache_key, created_at, blob)
+
+                        # Add cache info to context
+                        context['cache_hit'] = True
+                        context['cache_age'] = cache_age
+
+                        return cached_result
                 else:
                     logger.info(f"Cache EXPIRED for {step_name} (age: {int(cache_age)}s)")
 
@@ -111,9 +386,10 @@ def cache_step(ttl: int = 3600):
 
             # Save result to cache
             try:
-                with open(cache_file, 'wb') as f:
-                    pickle.dump(result, f)
-                logger.debug(f"Cached result for {step_name}")
+                blob = _SERIALIZER.dumps(result)
+                _enqueue_write(cache_file, blob)
+                _remember(cache_key, time.time(), blob)
+                logger.debug(f"Queued cached result for {step_name}")
             except Exception as e:
                 logger.warning(f"Failed to cache result: {e}")
 
@@ -127,6 +403,30 @@ def cache_step(ttl: int = 3600):
     return decorator
 
 
+def _scan_cache_files() -> list[os.DirEntry]:
+    """
+    List cache files across the shard subdirectories.
+
+    Files live in CACHE_DIR/<first two key chars>/; top-level files from the
+    unsharded layout are included as well. DirEntry caches its stat() result,
+    so callers can read size and mtime with one syscall per file.
+    """
+    cache_files = []
+    shard_dirs = []
+    with os.scandir(CACHE_DIR) as it:
+        for entry in it:
+            if entry.name.endswith('.pkl') and entry.is_file():
+                cache_files.append(entry)
+            elif len(entry.name) == 2 and entry.is_dir():
+                shard_dirs.append(entry.path)
+
+    for shard_dir in shard_dirs:
+        with os.scandir(shard_dir) as it:
+            cache_files.extend(e for e in it if e.name.endswith('.pkl') and e.is_file())
+
+    return cache_files
+
+
 def clear_cache(older_than: Optional[int] = None):
     """
     Clear the cache directory.
@@ -134,23 +434,71 @@ def clear_cache(older_than: Optional[int] = None):
     Args:
         older_than: Only clear files older than this many seconds (None = clear all)
     """
+    # Let queued writes land first so they aren't recreated after clearing
+    flush_cache_writes()
+    now = time.time()
+
+    # Drop matching in-process entries too, so cleared results aren't served from memory
+    if older_than is None:
+        _MEMO.clear()
+    else:
+        for cache_key in [k for k, (created_at, _) in _MEMO.items() if now - created_at > older_than]:
+            del _MEMO[cache_key]
+
     if not CACHE_DIR.exists():
         return
 
     cleared = 0
-    for cache_file in CACHE_DIR.glob("*.pkl"):
-        if older_than is None:
-            cache_file.unlink()
+    for entry in _scan_cache_files():
+        if older_than is None or now - entry.stat().st_mtime > older_than:
+            os.unlink(entry.path)
             cleared += 1
-        else:
-            age = time.time() - cache_file.stat().st_mtime
-            if age > older_than:
-                cache_file.unlink()
-                cleared += 1
 
     logger.info(f"Cleared {cleared} cache files")
 
 
+def enforce_cache_limit(max_mb: float = CACHE_LIMIT_MB) -> int:
+    """
+    Evict least recently used cache files until the cache fits in max_mb.
+
+    Recency is the later of a file's access and modification time, since
+    many filesystems only update atime lazily.
+
+    Args:
+        max_mb: Maximum total size of the cache in megabytes
+
+    Returns:
+        Number of files evicted
+    """
+    if not CACHE_DIR.exists():
+        return 0
+
+    max_bytes = max_mb * 1024 * 1024
+    files = []
+    total_size = 0
+    for entry in _scan_cache_files():
+        st = entry.stat()
+        files.append((max(st.st_atime, st.st_mtime), st.st_size, entry.path))
+        total_size += st.st_size
+
+    if total_size <= max_bytes:
+        return 0
+
+    evicted = 0
+    for _, size, path in sorted(files):
+        if total_size <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        total_size -= size
+        evicted += 1
+
+    logger.info(f"Evicted {evicted} cache files to stay under {max_mb} MB")
+    return evicted
+
+
 def cache_stats() -> dict[str, Any]:
     """
     Get cache statistics.
@@ -158,15 +506,9 @@ def cache_stats() -> dict[str, Any]:
     Returns:
         Dict with cache stats (file_count, total_size_mb, oldest_age, newest_age)
     """
-    if not CACHE_DIR.exists():
-        return {
-            'file_count': 0,
-            'total_size_mb': 0,
-            'oldest_age': None,
-            'newest_age': None
-        }
+    flush_cache_writes()
 
-    cache_files = list(CACHE_DIR.glob("*.pkl"))
+    cache_files = _scan_cache_files() if CACHE_DIR.exists() else []
 
     if not cache_files:
         return {
@@ -176,13 +518,15 @@ def cache_stats() -> dict[str, Any]:
             'newest_age': None
         }
 
-    total_size = sum(f.stat().st_size for f in cache_files)
+    # One stat per file; the aggregation runs in C via sum/min/max
+    stats = [entry.stat() for entry in cache_files]
+    total_size = sum(st.st_size for st in stats)
+    mtimes = [st.st_mtime for st in stats]
     now = time.time()
-    ages = [now - f.stat().st_mtime for f in cache_files]
 
     return {
         'file_count': len(cache_files),
         'total_size_mb': round(total_size / 1024 / 1024, 2),
-        'oldest_age': int(max(ages)),
-        'newest_age': int(min(ages))
+        'oldest_age': int(now - min(mtimes)),
+        'newest_age': int(now - max(mtimes))
     }
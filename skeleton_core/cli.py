@@ -5,20 +5,26 @@ Provides commands for listing available applications and running pipelines
 from YAML configuration files.
 """
 
+import hashlib
 import importlib
+import json
 import logging
 import os
 import shutil
+import sys
+import time
+from functools import lru_cache
+from inspect import getdoc
 from pathlib import Path
 from typing import Optional
 
 import typer
 
-from skeleton_core.cache import cache_stats, clear_cache
-from skeleton_core.config import build_pipeline_from_config, load_config
-from skeleton_core.scaffold import generate_app_files
-# Import built-in steps to auto-register them
-import skeleton_core.steps  # noqa: F401
+from skeleton_core.fast_cli import BANNER, find_apps, to_ascii
+
+# Framework modules (config/YAML, built-in steps and their HTTP/feed
+# dependencies, cache, scaffolding) are imported inside the commands that use
+# them, so light commands like list-apps start quickly.
 
 logger = logging.getLogger(__name__)
 
@@ -36,15 +42,26 @@ def safe_echo(text: str, **kwargs):
         typer.echo(text, **kwargs)
     except UnicodeEncodeError:
         # Remove emoji and special Unicode characters for Windows consoles
-        import re
-        ascii_text = re.sub(r'[\u2600-\u27BF\U0001F300-\U0001F9FF\u2192\u26A0\uFE0F]+', '', text)
-        ascii_text = ascii_text.replace('→', '->').replace('⚠', 'WARNING:').replace('✅', '[OK]').replace('❌', '[FAIL]')
-        typer.echo(ascii_text.strip(), **kwargs)
+        typer.echo(to_ascii(text), **kwargs)
+
+
+def _console_is_utf8() -> bool:
+    """Check whether both stdout and stderr can encode any Unicode text."""
+    for stream in (sys.stdout, sys.stderr):
+        encoding = getattr(stream, "encoding", None) or ""
+        if "utf" not in encoding.lower():
+            return False
+    return True
+
+
+# On UTF-8 consoles the ASCII fallback can never trigger, so skip the wrapper
+if _console_is_utf8():
+    safe_echo = typer.echo
 
 
 def print_banner():
     """Print a spooky ASCII banner."""
-    safe_echo("🦴 BONESAW CLI 🦴")
+    safe_echo(BANNER)
     typer.echo()
 
 
@@ -58,6 +75,8 @@ def create_app(
     
     Generates a complete app skeleton with pipelines, config, sample data, and README.
     """
+    from skeleton_core.scaffold import generate_app_files
+
     print_banner()
     
     # Compute target directory
@@ -81,6 +100,7 @@ def create_app(
         typer.echo(f"Error: Failed to create app: {e}", err=True)
         logger.error(f"App creation failed: {e}", exc_info=True)
         raise typer.Exit(code=1)
+    _app_exists.cache_clear()
     
     # Success message
     safe_echo(f"✅ Successfully created app '{app_name}' at {target_dir}")
@@ -125,6 +145,7 @@ def delete_app(
     
     try:
         shutil.rmtree(target_dir)
+        _app_exists.cache_clear()
         safe_echo(f"✅ Successfully deleted app '{app_name}'")
     except Exception as e:
         typer.echo(f"Error: Failed to delete app: {e}", err=True)
@@ -141,52 +162,72 @@ def list_apps():
     """
     print_banner()
     
-    apps_dir = Path("apps")
-    
-    if not apps_dir.exists():
+    try:
+        available_apps = find_apps()
+    except FileNotFoundError:
         typer.echo("No apps/ directory found.", err=True)
         raise typer.Exit(code=1)
     
-    # Find all subdirectories with a pipelines.py file
-    available_apps = []
-    for app_path in apps_dir.iterdir():
-        if app_path.is_dir() and (app_path / "pipelines.py").exists():
-            available_apps.append(app_path.name)
-    
     if not available_apps:
         typer.echo("No applications found in apps/")
         return
     
     typer.echo("Available applications:")
-    for app_name in sorted(available_apps):
+    for app_name in available_apps:
         typer.echo(f"  - {app_name}")
 
 
-def _get_step_description(step) -> str:
-    """
-    Extract a short description from a step instance.
-    
-    Args:
-        step: Step instance
-        
-    Returns:
-        First non-empty line of docstring, or fallback message
-    """
-    docstring = step.__class__.__doc__
+@lru_cache(maxsize=None)
+def _describe_class(cls: type) -> str:
+    """Extract first non-empty line of a class docstring (cached per class)."""
+    docstring = getdoc(cls)
     if docstring:
-        lines = [line.strip() for line in docstring.split('\n') if line.strip()]
-        if lines:
-            return lines[0]
+        return docstring.partition('\n')[0].strip()
     return "No description provided."
 
 
-def _load_app_and_config(app_name: Optional[str], config_path: str):
+@lru_cache(maxsize=32)
+def _load_config_cached(config_abspath: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a YAML config, reusing the result while the file is unchanged.
+
+    The modification time and size are part of the cache key, so edits are picked up.
+    The path is absolute so the same file is shared however it was named, and a
+    relative path isn't confused with another file after a chdir.
+    Callers must treat the returned dict as read-only.
+    """
+    from skeleton_core.config import load_config
+
+    return load_config(config_abspath)
+
+
+@lru_cache(maxsize=None)
+def _app_exists(app_name: str) -> bool:
+    """Check once per process whether apps/<app_name>/pipelines.py exists."""
+    return os.path.isfile(os.path.join("apps", app_name, "pipelines.py"))
+
+
+# Pipelines built for read-only commands, keyed by a hash of their config
+_READONLY_PIPELINES: dict[str, object] = {}
+_READONLY_PIPELINES_MAX = 32
+
+
+def _config_digest(config_dict: dict) -> str:
+    """Hash a config dict's content, independent of key order."""
+    encoded = json.dumps(config_dict, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _load_app_and_config(app_name: Optional[str], config_path: str, readonly: bool = False):
     """
     Load app module and config, returning the config dict.
 
     Args:
         app_name: Name of the app (None for standalone configs)
         config_path: Path to YAML config file
+        readonly: Reuse a previously built pipeline for the same config.
+            Only for callers that never run the steps, since step
+            instances may carry state.
 
     Returns:
         Tuple of (config_dict, pipeline)
@@ -194,11 +235,15 @@ def _load_app_and_config(app_name: Optional[str], config_path: str):
     Raises:
         typer.Exit on any error
     """
+    from skeleton_core.config import build_pipeline_from_config
+    # Import built-in steps to auto-register them
+    import skeleton_core.steps  # noqa: F401
+
     # If app is specified, import its pipelines module
     if app_name:
         # Validate that the app exists
-        app_pipelines_path = Path("apps") / app_name / "pipelines.py"
-        if not app_pipelines_path.exists():
+        if not _app_exists(app_name):
+            app_pipelines_path = Path("apps") / app_name / "pipelines.py"
             typer.echo(f"Error: Application '{app_name}' not found.", err=True)
             typer.echo(f"Expected to find: {app_pipelines_path}", err=True)
             raise typer.Exit(code=1)
@@ -214,9 +259,12 @@ def _load_app_and_config(app_name: Optional[str], config_path: str):
     else:
         logger.debug("Using built-in steps only (no app specified)")
     
-    # Load configuration
+    # Load configuration (parsed once per process while the file is unchanged)
     try:
-        config_dict = load_config(config_path)
+        stat = os.stat(config_path)
+        config_dict = _load_config_cached(
+            os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size
+        )
     except FileNotFoundError:
         typer.echo(f"Error: Config file not found: {config_path}", err=True)
         raise typer.Exit(code=1)
@@ -226,7 +274,16 @@ def _load_app_and_config(app_name: Optional[str], config_path: str):
     
     # Build pipeline
     try:
-        pipeline = build_pipeline_from_config(config_dict)
+        if readonly:
+            digest = _config_digest(config_dict)
+            pipeline = _READONLY_PIPELINES.get(digest)
+            if pipeline is None:
+                pipeline = build_pipeline_from_config(config_dict)
+                if len(_READONLY_PIPELINES) >= _READONLY_PIPELINES_MAX:
+                    _READONLY_PIPELINES.pop(next(iter(_READONLY_PIPELINES)))
+                _READONLY_PIPELINES[digest] = pipeline
+        else:
+            pipeline = build_pipeline_from_config(config_dict)
     except Exception as e:
         typer.echo(f"Error: Failed to build pipeline: {e}", err=True)
         logger.error(f"Pipeline build failed: {e}", exc_info=True)
@@ -253,15 +310,16 @@ def inspect(
         logger.info("Inspecting standalone pipeline")
 
     # Load app and config
-    config_dict, pipeline = _load_app_and_config(app_name, config)
+    config_dict, pipeline = _load_app_and_config(app_name, config, readonly=True)
 
     # Print pipeline summary
     typer.echo(f"Pipeline: {pipeline.name}")
     typer.echo()
 
     for i, step in enumerate(pipeline.steps, start=1):
-        step_type = step.__class__.__name__
-        description = _get_step_description(step)
+        step_class = type(step)
+        step_type = step_class.__name__
+        description = _describe_class(step_class)
         safe_echo(f"{i}. {step_type}  → {description}")
 
     typer.echo()
@@ -286,7 +344,7 @@ def dry_run(
         logger.info("Dry-run for standalone pipeline")
     
     # Load app and config
-    config_dict, pipeline = _load_app_and_config(app_name, config)
+    config_dict, pipeline = _load_app_and_config(app_name, config, readonly=True)
     
     # Print dry-run header
     safe_echo("⚠️  NOTE: This is a dry-run; no data will be processed or written.")
@@ -296,8 +354,9 @@ def dry_run(
     
     # Print detailed step information
     for i, step in enumerate(pipeline.steps, start=1):
-        step_type = step.__class__.__name__
-        description = _get_step_description(step)
+        step_class = type(step)
+        step_type = step_class.__name__
+        description = _describe_class(step_class)
         
         typer.echo(f"Step {i}: {step_type}")
         typer.echo(f"  - Description: {description}")
@@ -329,43 +388,13 @@ def run(
     """
     print_banner()
 
-    # If app is specified, import its pipelines module
     if app_name:
-        # Validate that the app exists
-        app_pipelines_path = Path("apps") / app_name / "pipelines.py"
-        if not app_pipelines_path.exists():
-            typer.echo(f"Error: Application '{app_name}' not found.", err=True)
-            typer.echo(f"Expected to find: {app_pipelines_path}", err=True)
-            raise typer.Exit(code=1)
-
-        # Import the app's pipelines module to register steps
-        try:
-            module_name = f"apps.{app_name}.pipelines"
-            logger.info(f"Importing {module_name} to register steps")
-            importlib.import_module(module_name)
-        except ImportError as e:
-            typer.echo(f"Error: Failed to import {module_name}: {e}", err=True)
-            raise typer.Exit(code=1)
+        logger.info(f"Running pipeline for app '{app_name}'")
     else:
         logger.info("Running with built-in steps only (no app specified)")
-    
-    # Load configuration
-    try:
-        config_dict = load_config(config)
-    except FileNotFoundError:
-        typer.echo(f"Error: Config file not found: {config}", err=True)
-        raise typer.Exit(code=1)
-    except Exception as e:
-        typer.echo(f"Error: Failed to load config: {e}", err=True)
-        raise typer.Exit(code=1)
-    
-    # Build pipeline
-    try:
-        pipeline = build_pipeline_from_config(config_dict)
-    except Exception as e:
-        typer.echo(f"Error: Failed to build pipeline: {e}", err=True)
-        logger.error(f"Pipeline build failed: {e}", exc_info=True)
-        raise typer.Exit(code=1)
+
+    # Load app and config
+    config_dict, pipeline = _load_app_and_config(app_name, config)
     
     # Check LLM configuration
     llm_provider = os.getenv("BONESAW_LLM_PROVIDER")
@@ -384,11 +413,10 @@ def run(
 
     try:
         # Pass context with use_llm flag and timestamp
-        from datetime import datetime
         context = {
             "app": app_name,
             "use_llm": use_llm,
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
         }
         result = pipeline.run(context=context)
         typer.echo()
@@ -410,6 +438,8 @@ def cache_info():
     """
     Show cache statistics.
     """
+    from skeleton_core.cache import cache_stats
+
     print_banner()
 
     stats = cache_stats()
@@ -441,6 +471,8 @@ def cache_clear(
     """
     Clear the pipeline cache.
     """
+    from skeleton_core.cache import cache_stats, clear_cache
+
     print_banner()
 
     stats = cache_stats()
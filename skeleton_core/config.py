@@ -5,10 +5,13 @@ This module provides the step registry mechanism and functions for loading
 YAML configuration files and constructing Pipeline instances from them.
 """
 
+import hashlib
+import inspect
+import json
 import logging
-from typing import Any
-
-import yaml
+import os
+from pathlib import Path
+from typing import Any, Optional
 
 from skeleton_core.pipeline import Pipeline, Step
 
@@ -17,6 +20,9 @@ logger = logging.getLogger(__name__)
 # Global registry mapping step type names to Step classes
 STEP_REGISTRY: dict[str, type[Step]] = {}
 
+# Constructor signatures, resolved once per step class
+_SIG_CACHE: dict[type, inspect.Signature] = {}
+
 
 def register_step(name: str):
     """
@@ -49,15 +55,40 @@ def register_step(name: str):
                 f"New class: {cls.__name__}"
             )
         STEP_REGISTRY[name] = cls
-        logger.debug(f"Registered step '{name}' -> {cls.__name__}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Registered step '{name}' -> {cls.__name__}")
         return cls
     return decorator
 
 
+def unregister_module_steps(module_name: str) -> list[str]:
+    """
+    Remove every registered step whose class was defined in a given module.
+    
+    Used when a module is dropped from sys.modules so that importing it
+    again can register its steps afresh instead of hitting the duplicate
+    check in register_step.
+    
+    Args:
+        module_name: Fully qualified module name, e.g. "apps.my_app.pipelines"
+        
+    Returns:
+        The step names that were removed
+    """
+    removed = [name for name, cls in STEP_REGISTRY.items() if cls.__module__ == module_name]
+    for name in removed:
+        del STEP_REGISTRY[name]
+    return removed
+
+
 def load_config(path: str) -> dict[str, Any]:
     """
     Load a YAML configuration file.
     
+    Parsed configs are kept as JSON sidecars under the Bonesaw cache
+    directory, keyed by the file's modification time and size, so an
+    unchanged config skips YAML parsing on later invocations.
+    
     Args:
         path: Filesystem path to the YAML configuration file
         
@@ -69,12 +100,75 @@ def load_config(path: str) -> dict[str, Any]:
         yaml.YAMLError: If the file contains invalid YAML
     """
     logger.info(f"Loading configuration from {path}")
-    with open(path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
+    stat = os.stat(path)
+    key = [stat.st_mtime_ns, stat.st_size]
+    sidecar = _config_sidecar_path(path)
+    
+    config = _read_config_sidecar(sidecar, key)
+    if config is not None:
+        logger.debug("Configuration loaded from parsed-config cache")
+        return config
+    
+    # Imported here so modules that only register steps don't pay for PyYAML
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+
+    # libyaml reads the raw bytes and handles the encoding itself; a buffer
+    # sized to the file turns its small chunked reads into a single syscall
+    with open(path, 'rb', buffering=max(stat.st_size + 1, 65536)) as f:
+        config = yaml.load(f, Loader=Loader)
+    _write_config_sidecar(sidecar, key, config)
     logger.debug("Configuration loaded successfully")
     return config
 
 
+def _config_sidecar_path(path: str) -> Path:
+    """Return the JSON sidecar location for a config file."""
+    from skeleton_core.cache import CACHE_DIR
+
+    digest = hashlib.sha256(os.path.abspath(path).encode('utf-8', 'surrogatepass')).hexdigest()
+    return CACHE_DIR / "configs" / f"{digest[:32]}.json"
+
+
+def _read_config_sidecar(sidecar: Path, key: list[int]) -> Optional[dict[str, Any]]:
+    """Return the cached config if the sidecar matches the file's current key."""
+    try:
+        with open(sidecar, 'rb') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    return cached.get("config")
+
+
+def _write_config_sidecar(sidecar: Path, key: list[int], config: Any) -> None:
+    """
+    Store a parsed config as JSON, replacing any previous sidecar atomically.
+    
+    Configs that JSON can't represent faithfully (dates, non-string keys, ...)
+    are simply not cached.
+    """
+    try:
+        payload = json.dumps({"key": key, "config": config}, ensure_ascii=False)
+        if json.loads(payload)["config"] != config:
+            return
+    except (TypeError, ValueError):
+        return
+    
+    tmp = sidecar.with_name(f"{sidecar.name}.tmp.{os.getpid()}")
+    try:
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(payload, encoding='utf-8')
+        os.replace(tmp, sidecar)
+    except OSError as e:
+        logger.debug(f"Could not write config cache {sidecar}: {e}")
+        tmp.unlink(missing_ok=True)
+
+
 def build_pipeline_from_config(config: dict[str, Any]) -> Pipeline:
     """
     Build a Pipeline instance from a configuration dictionary.
@@ -124,22 +218,26 @@ def build_pipeline_from_config(config: dict[str, Any]) -> Pipeline:
             
         step_type = step_config["type"]
         
-        # Look up step class in registry
-        if step_type not in STEP_REGISTRY:
+        # Look up step class in registry (one dict probe per step)
+        step_class = STEP_REGISTRY.get(step_type)
+        if step_class is None:
             available_types = ", ".join(sorted(STEP_REGISTRY.keys()))
             raise ValueError(
                 f"Unknown step type '{step_type}' at position {i + 1}. "
                 f"Available types: {available_types or '(none registered)'}"
             )
-            
-        step_class = STEP_REGISTRY[step_type]
         
         # Extract constructor parameters (all keys except 'type')
-        step_params = {k: v for k, v in step_config.items() if k != "type"}
+        step_params = step_config.copy()
+        del step_params["type"]
         
-        # Instantiate the step
+        # Instantiate the step, checking the params against its signature first
         try:
-            step_instance = step_class(**step_params)
+            sig = _SIG_CACHE.get(step_class)
+            if sig is None:
+                sig = _SIG_CACHE[step_class] = inspect.signature(step_class)
+            bound = sig.bind(**step_params)
+            step_instance = step_class(*bound.args, **bound.kwargs)
             steps.append(step_instance)
             logger.debug(f"Instantiated step {i + 1}: {step_type}")
         except TypeError as e:
@@ -0,0 +1,142 @@
+"""
+Typer-free fast path for Bonesaw's read-only CLI commands.
+
+Importing Typer (and Click underneath it) dominates the startup time of a
+trivial invocation. Commands that take no options - list-apps and
+cache-info - are answered here with plain prints; everything else falls
+through to the full Typer app in skeleton_core.cli.
+"""
+
+import os
+import re
+import sys
+from typing import Optional
+
+# ASCII fallback for consoles that can't encode emoji/Unicode symbols
+_ASCII_STRIP_RE = re.compile(r'[\u2600-\u27BF\U0001F300-\U0001F9FF\u2192\u26A0\uFE0F]+')
+_ASCII_TRANSLATE = str.maketrans({'→': '->', '⚠': 'WARNING:', '✅': '[OK]', '❌': '[FAIL]'})
+
+BANNER = "🦴 BONESAW CLI 🦴"
+
+# Below this many candidate app directories, stat them serially
+PARALLEL_STAT_THRESHOLD = 16
+
+
+def to_ascii(text: str) -> str:
+    """Strip emoji and special Unicode characters for consoles that can't encode them."""
+    return _ASCII_STRIP_RE.sub('', text).translate(_ASCII_TRANSLATE).strip()
+
+
+def _has_pipelines(app_dir: str) -> bool:
+    """Check whether an app directory contains a pipelines.py file."""
+    return os.path.isfile(os.path.join(app_dir, "pipelines.py"))
+
+
+def find_apps(apps_dir: str = "apps") -> list[str]:
+    """
+    Return the sorted names of app directories that contain a pipelines.py.
+
+    scandir reports whether each entry is a directory without an extra
+    stat call, leaving one stat per candidate app. With many candidates
+    those stats run on a small thread pool, which hides the round trips
+    when apps/ lives on a network filesystem.
+
+    Args:
+        apps_dir: Directory to scan for apps
+
+    Returns:
+        Sorted list of app names
+
+    Raises:
+        FileNotFoundError: If apps_dir doesn't exist
+    """
+    with os.scandir(apps_dir) as it:
+        candidates = [(entry.name, entry.path) for entry in it if entry.is_dir()]
+
+    if len(candidates) < PARALLEL_STAT_THRESHOLD:
+        found = [_has_pipelines(path) for _, path in candidates]
+    else:
+        # Imported here so the common small-apps/ case stays import-free
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(32, len(candidates))) as executor:
+            found = list(executor.map(_has_pipelines, [path for _, path in candidates]))
+
+    available_apps = [name for (name, _), ok in zip(candidates, found) if ok]
+    available_apps.sort()
+    return available_apps
+
+
+def _echo(text: str = "") -> None:
+    """Print a line, falling back to ASCII if the console can't encode it."""
+    try:
+        print(text)
+    except UnicodeEncodeError:
+        print(to_ascii(text))
+
+
+def _list_apps() -> int:
+    """Plain-print equivalent of the list-apps command."""
+    _echo(BANNER)
+    _echo()
+
+    try:
+        available_apps = find_apps()
+    except FileNotFoundError:
+        print("No apps/ directory found.", file=sys.stderr)
+        return 1
+
+    if not available_apps:
+        _echo("No applications found in apps/")
+        return 0
+
+    _echo("Available applications:")
+    for app_name in available_apps:
+        _echo(f"  - {app_name}")
+    return 0
+
+
+def _cache_info() -> int:
+    """Plain-print equivalent of the cache-info command."""
+    from skeleton_core.cache import cache_stats
+
+    _echo(BANNER)
+    _echo()
+
+    stats = cache_stats()
+
+    if stats['file_count'] == 0:
+        _echo("Cache is empty")
+        return 0
+
+    _echo("📊 Cache Statistics:")
+    _echo(f"  Files: {stats['file_count']}")
+    _echo(f"  Total size: {stats['total_size_mb']} MB")
+    _echo(f"  Oldest entry: {stats['oldest_age']}s ago")
+    _echo(f"  Newest entry: {stats['newest_age']}s ago")
+    return 0
+
+
+_FAST_COMMANDS = {
+    "list-apps": _list_apps,
+    "cache-info": _cache_info,
+}
+
+
+def fast_main(argv: list[str]) -> Optional[int]:
+    """
+    Handle argument-free read-only commands without importing Typer.
+
+    Args:
+        argv: Command-line arguments, excluding the program name
+
+    Returns:
+        The exit code if the command was handled here, or None if the
+        caller should dispatch to the full Typer app
+    """
+    if len(argv) != 1:
+        return None
+    handler = _FAST_COMMANDS.get(argv[0])
+    if handler is None:
+        return None
+    return handler()
@@ -43,6 +43,8 @@ class Pipeline:
     common context dictionary for storing metadata and intermediate state.
     """
     
+    __slots__ = ("name", "steps")
+    
     def __init__(self, steps: list[Step], name: Optional[str] = None):
         """
         Initialize a pipeline with an ordered list of steps.
@@ -72,32 +74,45 @@ class Pipeline:
         if context is None:
             context = {}
             
-        logger.info(f"Pipeline '{self.name}' starting with {len(self.steps)} steps")
+        steps = self.steps
+        name = self.name
+        total = len(steps)
+        logger.info(f"Pipeline '{name}' starting with {total} steps")
         
         # Start with initial data
         data = initial_data
 
-        # Execute each step sequentially
-        for i, step in enumerate(self.steps):
-            step_name = step.__class__.__name__
+        # Per-step progress logging costs more than a cheap step itself, so
+        # when INFO is off run a loop that only calls the steps. The step
+        # name is then worked out on failure only.
+        if not logger.isEnabledFor(logging.INFO):
+            i = 0
             try:
-                logger.info(f"Step {i + 1}/{len(self.steps)}: {step_name} starting")
-
-                # Run the step and capture its output
-                data = step.run(data, context)
+                for i, step in enumerate(steps, 1):
+                    data = step.run(data, context)
+            except Exception as e:
+                raise RuntimeError(
+                    f"Pipeline '{name}' failed at step {i}/{total} "
+                    f"({type(steps[i - 1]).__name__}): {e}"
+                ) from e
+            return data
 
-                logger.info(f"Step {i + 1}/{len(self.steps)}: {step_name} completed")
+        # Execute each step sequentially
+        for i, step in enumerate(steps, 1):
+            step_name = type(step).__name__
+            logger.info(f"Step {i}/{total}: {step_name} starting")
 
+            # Run the step and capture its output. The failure is not logged
+            # here: the original traceback travels with the chained exception.
+            try:
+                data = step.run(data, context)
             except Exception as e:
-                logger.error(
-                    f"Pipeline '{self.name}' failed at step {i + 1}/{len(self.steps)} "
-                    f"({step_name}): {e}",
-                    exc_info=True
-                )
                 raise RuntimeError(
-                    f"Pipeline '{self.name}' failed at step {i + 1}/{len(self.steps)} "
+                    f"Pipeline '{name}' failed at step {i}/{total} "
                     f"({step_name}): {e}"
                 ) from e
 
-        logger.info(f"Pipeline '{self.name}' completed successfully")
+            logger.info(f"Step {i}/{total}: {step_name} completed")
+
+        logger.info(f"Pipeline '{name}' completed successfully")
         return data
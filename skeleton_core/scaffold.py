@@ -5,46 +5,19 @@ Provides functions to generate new application skeletons with working pipelines.
 """
 
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
+from string import Template
 
 from skeleton_core.utils import validate_file_path  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
-
-def generate_app_files(app_name: str, target_dir: Path) -> None:
-    """
-    Generate all files for a new Bonesaw app.
-    
-    Args:
-        app_name: Name of the app
-        target_dir: Target directory (apps/<app_name>/)
-    """
-    # Ensure target directory exists
-    target_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Generate each file
-    _write_init_py(target_dir)
-    _write_pipelines_py(app_name, target_dir)
-    _write_config_yml(app_name, target_dir)
-    _write_sample_input(app_name, target_dir)
-    _write_readme(app_name, target_dir)
-    
-    logger.info(f"Generated all files for app '{app_name}'")
-
-
-def _write_init_py(target_dir: Path) -> None:
-    """Write __init__.py file."""
-    content = f'"""{target_dir.name.replace("_", " ").title()} application."""\n'
-    (target_dir / "__init__.py").write_text(content, encoding="utf-8")
-
-
-def _write_pipelines_py(app_name: str, target_dir: Path) -> None:  # noqa: F821
-    """Write pipelines.py with four working steps including LLM summary."""
-    # Template contains Python code with variables that ruff thinks are undefined
-    # but they're actually just template strings that will be written to a file
-    content = f'''"""  # noqa: F821
-{app_name.replace("_", " ").title()} - Pipeline steps for text processing.
+# File templates are built once at import. string.Template's $-placeholders
+# leave the braces in the embedded Python code alone.
+_PIPELINES_TPL = Template('''"""  # noqa: F821
+${title} - Pipeline steps for text processing.
 
 This module defines steps for loading, transforming, and reporting on text files.
 """
@@ -54,9 +27,21 @@ from typing import Any
 
 from skeleton_core.config import register_step
 from skeleton_core.summarization import summarize_text
+from skeleton_core.utils import read_text_file, validate_file_path
 
 logger = logging.getLogger(__name__)
 
+# Fixed report sections, encoded once at import
+_REPORT_HEADER = "# 🩸 Bonesaw Text Report\\n\\n## Summary\\n\\n".encode('utf-8')
+_FULL_TEXT_HEADER = b"## Full Transformed Text\\n\\n```\\n"
+_FENCE_CLOSE = b"```\\n"
+
+
+def _emit(f, text: str) -> None:
+    """Write one line of UTF-8 text followed by a newline."""
+    f.write(text.encode('utf-8'))
+    f.write(b'\\n')
+
 
 @register_step("load_text")
 class LoadTextStep:
@@ -79,14 +64,17 @@ class LoadTextStep:
     
     def run(self, data: Any, context: dict[str, Any]) -> list[str]:
         """Load text file and return lines."""
-        validated_path = validate_file_path(self.input_path)  # noqa: F821
-        logger.info(f"Loading text from {{validated_path}}")
+        validated_path = validate_file_path(self.input_path)
+        logger.info("Loading text from %s", validated_path)
 
-        with open(validated_path, 'r', encoding='utf-8') as f:
-            lines = [line.rstrip('\\n') for line in f]  # noqa: F821
+        # Split the whole text in C. Only '\\n' counts as a line break here;
+        # splitlines() would also split on form feeds and other separators.
+        lines = read_text_file(validated_path).split('\\n')  # noqa: F821
+        if not lines[-1]:
+            lines.pop()
 
         context['source_file'] = str(validated_path)
-        logger.info(f"Loaded {{len(lines)}} lines")  # noqa: F821
+        logger.info("Loaded %d lines", len(lines))  # noqa: F821
 
         return lines  # noqa: F821
 
@@ -117,26 +105,26 @@ class TransformTextStep:
         lines = data  # noqa: F821
         transformations = []
 
-        logger.info(f"Transforming {{len(lines)}} lines")  # noqa: F821
+        logger.info("Transforming %d lines", len(lines))  # noqa: F821
 
-        result = []
-        for i, line in enumerate(lines):  # noqa: F821
-            transformed = line  # noqa: F821
+        # Pick the loop body once from the flags instead of testing them per line
+        if self.uppercase and self.prefix_line_numbers:
+            result = [f"{i}: {line.upper()}" for i, line in enumerate(lines, 1)]  # noqa: F821
+        elif self.uppercase:
+            result = [line.upper() for line in lines]  # noqa: F821
+        elif self.prefix_line_numbers:
+            result = [f"{i}: {line}" for i, line in enumerate(lines, 1)]  # noqa: F821
+        else:
+            result = list(lines)  # noqa: F821
 
+        if result:
             if self.uppercase:
-                transformed = transformed.upper()  # noqa: F821
-                if 'uppercase' not in transformations:  # noqa: F821
-                    transformations.append('uppercase')
-
+                transformations.append('uppercase')
             if self.prefix_line_numbers:
-                transformed = f"{{i + 1}}: {{transformed}}"  # noqa: F821
-                if 'line_numbers' not in transformations:  # noqa: F821
-                    transformations.append('line_numbers')
-
-            result.append(transformed)
+                transformations.append('line_numbers')
 
         context['transformations_applied'] = transformations  # noqa: F821
-        logger.info(f"Applied transformations: {{', '.join(transformations)}}")  # noqa: F821
+        logger.info("Applied transformations: %s", ', '.join(transformations))  # noqa: F821
 
         return result
 
@@ -164,44 +152,39 @@ class WriteTextReportStep:
         """Generate and write markdown report."""
         lines = data  # noqa: F821
 
-        logger.info(f"Writing report to {{self.output_path}}")  # noqa: F821
+        logger.info("Writing report to %s", self.output_path)  # noqa: F821
 
-        # Build markdown content
+        # Summary, transformations and preview are small; collect them as text
         report_lines = [
-            "# 🩸 Bonesaw Text Report",
-            "",
-            "## Summary",
-            "",
-            f"**Total lines processed:** {{len(lines)}}",  # noqa: F821
+            f"**Total lines processed:** {len(lines)}",  # noqa: F821
             ""
         ]
 
         # Show transformations if available
         if 'transformations_applied' in context:
             transformations = context['transformations_applied']  # noqa: F821
-            report_lines.append(f"**Transformations applied:** {{', '.join(transformations)}}")  # noqa: F821
+            report_lines.append(f"**Transformations applied:** {', '.join(transformations)}")  # noqa: F821
             report_lines.append("")
 
         # Show first few lines as preview
         preview_count = min(3, len(lines))  # noqa: F821
         if preview_count > 0:  # noqa: F821
-            report_lines.append(f"## Preview (first {{preview_count}} lines)")  # noqa: F821
+            report_lines.append(f"## Preview (first {preview_count} lines)")  # noqa: F821
             report_lines.append("")
             for line in lines[:preview_count]:  # noqa: F821
-                report_lines.append(f"- {{line}}")  # noqa: F821
+                report_lines.append(f"- {line}")  # noqa: F821
             report_lines.append("")
         
-        # Include full transformed text
-        report_lines.append("## Full Transformed Text")
-        report_lines.append("")
-        report_lines.append("```")
-        report_lines.extend(lines)
-        report_lines.append("```")
-        report_lines.append("")
-        
-        # Write to file
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            f.write('\\n'.join(report_lines))
+        # Stream everything through a 1 MiB buffer; the fixed sections are
+        # already bytes, so only the variable lines get encoded here
+        with open(self.output_path, 'wb', buffering=1 << 20) as f:
+            f.write(_REPORT_HEADER)
+            for line in report_lines:
+                _emit(f, line)
+            f.write(_FULL_TEXT_HEADER)
+            for line in lines:  # noqa: F821
+                _emit(f, line)  # noqa: F821
+            f.write(_FENCE_CLOSE)
         
         context['report_path'] = self.output_path
         logger.info("Report written successfully")
@@ -247,45 +230,33 @@ class TextLLMSummaryStep:
         logger.info("Summary appended to report")
         
         return lines
-'''
-    (target_dir / "pipelines.py").write_text(content, encoding="utf-8")
-
+''')
 
-def _write_config_yml(app_name: str, target_dir: Path) -> None:
-    """Write config.example.yml with LLM summary step."""
-    content = f'''pipeline:
-  name: {app_name}
+_CONFIG_TPL = Template('''pipeline:
+  name: ${app_name}
   steps:
     - type: load_text
-      input_path: "apps/{app_name}/sample_input.txt"
+      input_path: "apps/${app_name}/sample_input.txt"
     
     - type: transform_text
       uppercase: true
       prefix_line_numbers: true
     
     - type: write_text_report
-      output_path: "apps/{app_name}/output_report.md"
+      output_path: "apps/${app_name}/output_report.md"
     
     - type: text_llm_summary
-      report_path: "apps/{app_name}/output_report.md"
-'''
-    (target_dir / "config.example.yml").write_text(content, encoding="utf-8")
+      report_path: "apps/${app_name}/output_report.md"
+''')
 
-
-def _write_sample_input(app_name: str, target_dir: Path) -> None:
-    """Write sample_input.txt."""
-    content = f'''Welcome to the Bonesaw pipeline.
-This file was generated for app "{app_name}".
+_SAMPLE_TPL = Template('''Welcome to the Bonesaw pipeline.
+This file was generated for app "${app_name}".
 Each line will be transformed and reported.
 The framework makes it easy to build automation pipelines.
 Try modifying the config to change transformations!
-'''
-    (target_dir / "sample_input.txt").write_text(content, encoding="utf-8")
-
+''')
 
-def _write_readme(app_name: str, target_dir: Path) -> None:
-    """Write README.md."""
-    content = f'''# {app_name.replace("_", " ").title()}
+_README_TPL = Template('''# ${title}
 
 A Bonesaw application for text processing and transformation.
 
@@ -304,7 +275,7 @@ This app demonstrates the Bonesaw pipeline framework with a simple text processi
 See the pipeline structure without executing:
 
 ```bash
-python main.py inspect --app {app_name} --config apps/{app_name}/config.example.yml
+python main.py inspect --app ${app_name} --config apps/${app_name}/config.example.yml
 ```
 
 ### Dry Run
@@ -312,7 +283,7 @@ python main.py inspect --app {app_name} --config apps/{app_name}/config.example.
 Preview what would be executed:
 
 ```bash
-python main.py dry-run --app {app_name} --config apps/{app_name}/config.example.yml
+python main.py dry-run --app ${app_name} --config apps/${app_name}/config.example.yml
 ```
 
 ### Execute the Pipeline
@@ -320,14 +291,14 @@ python main.py dry-run --app {app_name} --config apps/{app_name}/config.example.
 Run the full pipeline:
 
 ```bash
-python main.py run --app {app_name} --config apps/{app_name}/config.example.yml
+python main.py run --app ${app_name} --config apps/${app_name}/config.example.yml
 ```
 
 ## Output
 
 The pipeline generates a markdown report at:
 ```
-apps/{app_name}/output_report.md
+apps/${app_name}/output_report.md
 ```
 
 The report includes:
@@ -351,5 +322,81 @@ Load Text → Transform Text → Write Report
 ```
 
 Each step is independent and composable, following the Bonesaw framework patterns.
-'''
-    (target_dir / "README.md").write_text(content, encoding="utf-8")
+''')
+
+
+def _title(app_name: str) -> str:
+    """Turn an app name like my_app into a title like My App."""
+    return app_name.replace("_", " ").title()
+
+
+def generate_app_files(app_name: str, target_dir: Path) -> None:
+    """
+    Generate all files for a new Bonesaw app.
+    
+    Args:
+        app_name: Name of the app
+        target_dir: Target directory (apps/<app_name>/)
+    """
+    # Render everything up front so the directory is only touched once all
+    # templates have succeeded
+    files = [
+        ("__init__.py", _render_init_py(target_dir.name)),
+        ("pipelines.py", _render_pipelines_py(app_name)),
+        ("config.example.yml", _render_config_yml(app_name)),
+        ("sample_input.txt", _render_sample_input(app_name)),
+        ("README.md", _render_readme(app_name)),
+    ]
+
+    # Ensure target directory exists
+    target_dir.mkdir(parents=True, exist_ok=True)
+
+    for name, payload in files:
+        _write_bytes(target_dir / name, payload)
+    
+    logger.info("Generated all files for app '%s'", app_name)
+
+
+def _write_bytes(path: Path, payload: bytes) -> None:
+    """Write a whole file with raw os calls, skipping the buffered file object."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# The renderers are pure functions of the app name, so repeated scaffolding
+# in one process (batch creation, tests) reuses the encoded output
+
+
+@lru_cache(maxsize=128)
+def _render_init_py(dir_name: str) -> bytes:
+    """Render __init__.py."""
+    return f'"""{_title(dir_name)} application."""\n'.encode("utf-8")
+
+
+@lru_cache(maxsize=128)
+def _render_pipelines_py(app_name: str) -> bytes:
+    """Render pipelines.py with four working steps including LLM summary."""
+    return _PIPELINES_TPL.substitute(app_name=app_name, title=_title(app_name)).encode("utf-8")
+
+
+@lru_cache(maxsize=128)
+def _render_config_yml(app_name: str) -> bytes:
+    """Render config.example.yml with LLM summary step."""
+    return _CONFIG_TPL.substitute(app_name=app_name).encode("utf-8")
+
+
+@lru_cache(maxsize=128)
+def _render_sample_input(app_name: str) -> bytes:
+    """Render sample_input.txt."""
+    return _SAMPLE_TPL.substitute(app_name=app_name).encode("utf-8")
+
+
+@lru_cache(maxsize=128)
+def _render_readme(app_name: str) -> bytes:
+    """Render README.md."""
+    return _README_TPL.substitute(app_name=app_name, title=_title(app_name)).encode("utf-8")
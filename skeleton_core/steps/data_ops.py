@@ -7,17 +7,38 @@ Provides steps for working with structured data (JSON, CSV, YAML, RSS/Atom).
 import csv
 import json
 import logging
-from io import StringIO
-from typing import Any, Optional
-
-import feedparser
-import yaml
+from functools import lru_cache
+from io import BytesIO, StringIO, TextIOWrapper
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Callable, Optional
+from xml.etree.ElementTree import ParseError, XMLPullParser
 
 from skeleton_core.config import register_step
+from skeleton_core.utils import validate_file_path
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON parsing/encoding
+    orjson = None
+
+# feedparser and PyYAML are imported on first use, so pipelines that never
+# touch RSS or YAML don't pay for them at startup
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _yaml_classes() -> tuple[Any, Any]:
+    """Return (Loader, Dumper), preferring the libyaml C bindings when available."""
+    try:
+        from yaml import CDumper, CSafeLoader
+        return CSafeLoader, CDumper
+    except ImportError:
+        from yaml import Dumper, SafeLoader
+        return SafeLoader, Dumper
+
+
 @register_step("parse_json")
 class ParseJSONStep:
     """
@@ -32,14 +53,55 @@ class ParseJSONStep:
         """Parse JSON."""
         json_text = str(data)
 
-        logger.info(f"Parsing JSON ({len(json_text)} chars)")
+        logger.info("Parsing JSON (%d chars)", len(json_text))
 
-        result = json.loads(json_text)
+        if orjson is not None:
+            try:
+                result = orjson.loads(json_text)
+            except orjson.JSONDecodeError:
+                # NaN/Infinity and integers beyond 64 bits are only accepted
+                # by the stdlib parser; it also reports real syntax errors
+                result = json.loads(json_text)
+        else:
+            result = json.loads(json_text)
 
         logger.info("Parsed successfully")
         return result
 
 
+def _orjson_matches_json(data: Any) -> bool:
+    """
+    Check that orjson would encode data exactly like json.dumps.
+
+    Only dicts with str keys, lists, tuples, str, int, bool, None and floats
+    qualify. Floats must be zero or within [1e-4, 1e16): outside that range
+    repr() switches to exponent notation, which orjson spells differently,
+    and orjson writes NaN and Infinity as null.
+    """
+    stack = [data]
+    pop = stack.pop
+    push = stack.extend
+    while stack:
+        value = pop()
+        kind = type(value)
+        if kind is str or kind is int or kind is bool or value is None:
+            continue
+        if kind is float:
+            if value == 0.0 or 1e-4 <= abs(value) < 1e16:
+                continue
+            return False
+        if kind is dict:
+            for key in value:
+                if type(key) is not str:
+                    return False
+            push(value.values())
+        elif kind is list or kind is tuple:
+            push(value)
+        else:
+            return False
+    return True
+
+
 @register_step("to_json")
 class ToJSONStep:
     """
@@ -63,11 +125,24 @@ class ToJSONStep:
         """Convert to JSON."""
         logger.info("Converting to JSON")
 
-        result = json.dumps(data, indent=self.indent, ensure_ascii=self.ensure_ascii)
+        result = None
+        # orjson matches the stdlib's indent=2, non-ASCII-preserving layout for
+        # plain JSON values; anything it would write differently (NaN, Infinity,
+        # exponent floats, other types), and other layouts, go through json
+        if (
+            orjson is not None and self.indent == 2 and not self.ensure_ascii
+            and _orjson_matches_json(data)
+        ):
+            try:
+                result = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+            except TypeError:
+                pass
+        if result is None:
+            result = json.dumps(data, indent=self.indent, ensure_ascii=self.ensure_ascii)
 
         context['output_size'] = len(result)
 
-        logger.info(f"Generated {len(result)} chars")
+        logger.info("Generated %d chars", len(result))
         return result
 
 
@@ -85,9 +160,12 @@ class ParseYAMLStep:
         """Parse YAML."""
         yaml_text = str(data)
 
-        logger.info(f"Parsing YAML ({len(yaml_text)} chars)")
+        logger.info("Parsing YAML (%d chars)", len(yaml_text))
+
+        import yaml
 
-        result = yaml.safe_load(yaml_text)
+        loader, _ = _yaml_classes()
+        result = yaml.load(yaml_text, Loader=loader)
 
         logger.info("Parsed successfully")
         return result
@@ -114,149 +192,258 @@ class ToYAMLStep:
         """Convert to YAML."""
         logger.info("Converting to YAML")
 
-        result = yaml.dump(data, default_flow_style=self.default_flow_style)
+        import yaml
+
+        _, dumper = _yaml_classes()
+        result = yaml.dump(data, Dumper=dumper, default_flow_style=self.default_flow_style)
 
         context['output_size'] = len(result)
 
-        logger.info(f"Generated {len(result)} chars")
+        logger.info("Generated %d chars", len(result))
         return result
 
 
 @register_step("parse_csv")
 class ParseCSVStep:
     """
-    Parse CSV string to list of dicts.
+    Parse CSV to list of dicts, or to compact tuples.
 
-    Input: str (CSV text)
-    Output: list[dict] (rows)
-    Context: Writes 'row_count', 'column_count'
+    Input: str (CSV text), bytes (UTF-8 CSV), or a Path to read from
+    Output: list[dict] (rows), or list[tuple] when row_type is 'tuple'
+    Context: Writes 'row_count', 'column_count', and 'csv_header' for tuple rows
     """
 
-    def __init__(self, has_header: bool = True, delimiter: str = ','):
+    def __init__(
+        self,
+        has_header: bool = True,
+        delimiter: str = ',',
+        row_type: str = 'dict',
+        input_path: Optional[str] = None
+    ):
         """
         Args:
             has_header: Whether first row is header
             delimiter: CSV delimiter
+            row_type: 'dict' for one dict per row, or 'tuple' for plain tuples
+                with the header stored once in context['csv_header']
+            input_path: Optional CSV file to parse directly instead of the
+                step input, without holding the whole text in memory
         """
+        if row_type not in ('dict', 'tuple'):
+            raise ValueError(f"row_type must be 'dict' or 'tuple', got {row_type!r}")
         self.has_header = has_header
         self.delimiter = delimiter
+        self.row_type = row_type
+        self.input_path = input_path
+
+    def _open_source(self, data: Any) -> tuple[Any, str]:
+        """Return a text stream over the CSV and a description for logging."""
+        path = self.input_path or (data if isinstance(data, Path) else None)
+        if path is not None:
+            validated_path = validate_file_path(path)
+            stream = open(validated_path, 'r', encoding='utf-8', newline='', buffering=1 << 20)
+            return stream, f"file {validated_path}"
+
+        if isinstance(data, (bytes, bytearray)):
+            # Decode incrementally rather than materializing a full str copy
+            return TextIOWrapper(BytesIO(data), encoding='utf-8', newline=''), f"{len(data)} bytes"
 
-    def run(self, data: Any, context: dict[str, Any]) -> list[dict[str, Any]]:
-        """Parse CSV."""
         csv_text = str(data)
+        return StringIO(csv_text), f"{len(csv_text)} chars"
 
-        logger.info(f"Parsing CSV ({len(csv_text)} chars)")
+    def run(self, data: Any, context: dict[str, Any]) -> list[Any]:
+        """Parse CSV."""
+        stream, description = self._open_source(data)
 
-        reader = csv.DictReader(
-            StringIO(csv_text),
-            delimiter=self.delimiter
-        ) if self.has_header else csv.reader(StringIO(csv_text), delimiter=self.delimiter)
+        logger.info("Parsing CSV (%s)", description)
 
-        rows = list(reader)
+        with stream:
+            if self.row_type == 'tuple':
+                # Tuples skip DictReader's per-row dict and repeated key references
+                reader = csv.reader(stream, delimiter=self.delimiter)
+                header = next(reader, []) if self.has_header else []
+                rows = list(map(tuple, reader))
+            else:
+                reader = csv.DictReader(
+                    stream,
+                    delimiter=self.delimiter
+                ) if self.has_header else csv.reader(stream, delimiter=self.delimiter)
+                rows = list(reader)
 
         context['row_count'] = len(rows)
-        if rows and isinstance(rows[0], dict):
+        if self.row_type == 'tuple':
+            if header:
+                context['csv_header'] = header
+                context['column_count'] = len(header)
+        elif rows and isinstance(rows[0], dict):
             context['column_count'] = len(rows[0])
 
-        logger.info(f"Parsed {len(rows)} rows")
+        logger.info("Parsed %d rows", len(rows))
         return rows
 
 
 @register_step("to_csv")
 class ToCSVStep:
     """
-    Convert list of dicts to CSV string.
+    Convert list of dicts to CSV string, or write it straight to a file.
 
     Input: list[dict] (rows)
-    Output: str (CSV text)
+    Output: str (CSV text, or the file path when output_path is set)
     Context: Writes 'row_count', 'output_size'
     """
 
-    def __init__(self, delimiter: str = ','):
+    def __init__(self, delimiter: str = ',', output_path: Optional[str] = None):
         """
         Args:
             delimiter: CSV delimiter
+            output_path: Optional file to write the CSV to directly, skipping
+                the intermediate string
         """
         self.delimiter = delimiter
+        self.output_path = output_path
 
     def run(self, data: Any, context: dict[str, Any]) -> str:
         """Convert to CSV."""
-        rows = list(data)
+        rows = data if isinstance(data, list) else list(data)
+
+        logger.info("Converting %d rows to CSV", len(rows))
+
+        if self.output_path:
+            output_path = Path(self.output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+                self._write_rows(f, rows)
 
-        logger.info(f"Converting {len(rows)} rows to CSV")
+            context['row_count'] = len(rows)
+            context['output_size'] = output_path.stat().st_size
+
+            logger.info("Wrote %d bytes to %s", context['output_size'], output_path)
+            return str(output_path)
 
         if not rows:
             return ""
 
         output = StringIO()
-        writer = csv.DictWriter(
-            output,
-            fieldnames=rows[0].keys(),
-            delimiter=self.delimiter
-        )
-
-        writer.writeheader()
-        writer.writerows(rows)
-
+        self._write_rows(output, rows)
         result = output.getvalue()
 
         context['row_count'] = len(rows)
         context['output_size'] = len(result)
 
-        logger.info(f"Generated {len(result)} chars")
+        logger.info("Generated %d chars", len(result))
         return result
 
+    def _write_rows(self, output: Any, rows: list[dict[str, Any]]) -> None:
+        """Write the header and rows to a text stream."""
+        if not rows:
+            return
+
+        fieldnames = list(rows[0].keys())
+        header = rows[0].keys()
+
+        if all(row.keys() == header for row in rows):
+            # Uniform schema: pull each row's columns out in C and write plain rows
+            writer = csv.writer(output, delimiter=self.delimiter)
+            writer.writerow(fieldnames)
+            if len(fieldnames) == 1:
+                field = fieldnames[0]
+                writer.writerows((row[field],) for row in rows)
+            else:
+                get_columns = itemgetter(*fieldnames)
+                writer.writerows(map(get_columns, rows))
+        else:
+            # DictWriter fills missing fields and rejects unexpected ones
+            dict_writer = csv.DictWriter(
+                output,
+                fieldnames=fieldnames,
+                delimiter=self.delimiter
+            )
+            dict_writer.writeheader()
+            dict_writer.writerows(rows)
+
 
 @register_step("filter_data")
 class FilterDataStep:
     """
     Filter list items using a simple condition.
 
-    Input: list[dict] (items)
+    Input: list[dict] (items), or list[tuple] rows when field_index is set
     Output: list[dict] (filtered items)
     Context: Writes 'input_count', 'output_count'
     """
 
-    def __init__(self, field: str, value: Any = None, condition: str = 'equals'):
+    def __init__(
+        self,
+        field: Optional[str] = None,
+        value: Any = None,
+        condition: str = 'equals',
+        field_index: Optional[int] = None
+    ):
         """
         Args:
             field: Field name to check
             value: Value to compare against
             condition: Comparison type ('equals', 'contains', 'gt', 'lt', 'exists')
+            field_index: Column position to check instead of a field name,
+                for tuple rows from parse_csv with row_type 'tuple'
         """
+        if field is None and field_index is None:
+            raise ValueError("filter_data needs either 'field' or 'field_index'")
         self.field = field
         self.value = value
         self.condition = condition
+        self.field_index = field_index
+        if field_index is None:
+            self._pred = self._build_predicate(field, value, condition)
+        else:
+            self._pred = self._build_index_predicate(field_index, value, condition)
+
+    @staticmethod
+    def _build_predicate(field: str, value: Any, condition: str) -> Callable[[Any], bool]:
+        """Resolve the condition once into a predicate over a single item."""
+        if condition == 'equals':
+            return lambda item: item.get(field) == value
+        if condition == 'contains':
+            return lambda item: value in str(item.get(field))
+        if condition == 'gt':
+            return lambda item: item.get(field) > value
+        if condition == 'lt':
+            return lambda item: item.get(field) < value
+        if condition == 'exists':
+            return lambda item: field in item
+        # Unknown conditions keep nothing
+        return lambda item: False
+
+    @staticmethod
+    def _build_index_predicate(index: int, value: Any, condition: str) -> Callable[[Any], bool]:
+        """Like _build_predicate, but for sequence rows; short rows read as missing."""
+        if condition == 'equals':
+            return lambda item: (item[index] if index < len(item) else None) == value
+        if condition == 'contains':
+            return lambda item: value in str(item[index] if index < len(item) else None)
+        if condition == 'gt':
+            return lambda item: (item[index] if index < len(item) else None) > value
+        if condition == 'lt':
+            return lambda item: (item[index] if index < len(item) else None) < value
+        if condition == 'exists':
+            return lambda item: index < len(item)
+        # Unknown conditions keep nothing
+        return lambda item: False
 
     def run(self, data: Any, context: dict[str, Any]) -> list[dict[str, Any]]:
         """Filter data."""
-        items = list(data)
-
-        logger.info(f"Filtering {len(items)} items by {self.field} {self.condition} {self.value}")
+        items = data if isinstance(data, list) else list(data)
 
-        filtered = []
-        for item in items:
-            field_value = item.get(self.field)
+        target = self.field if self.field_index is None else f"column {self.field_index}"
+        logger.info("Filtering %d items by %s %s %r", len(items), target, self.condition, self.value)
 
-            keep = False
-            if self.condition == 'equals':
-                keep = field_value == self.value
-            elif self.condition == 'contains':
-                keep = self.value in str(field_value)
-            elif self.condition == 'gt':
-                keep = field_value > self.value
-            elif self.condition == 'lt':
-                keep = field_value < self.value
-            elif self.condition == 'exists':
-                keep = self.field in item
-
-            if keep:
-                filtered.append(item)
+        pred = self._pred
+        filtered = [item for item in items if pred(item)]
 
         context['input_count'] = len(items)
         context['output_count'] = len(filtered)
 
-        logger.info(f"Kept {len(filtered)} items")
+        logger.info("Kept %d items", len(filtered))
         return filtered
 
 
@@ -270,18 +457,37 @@ class ParseRSSStep:
     Context: Writes 'feed_title', 'entry_count'
     """
 
-    def __init__(self, limit: Optional[int] = None):
+    def __init__(self, limit: Optional[int] = None, use_fast: bool = False):
         """
         Args:
             limit: Maximum number of entries to return (None for all)
+            use_fast: Extract fields with a streaming XML parser instead of
+                feedparser. Much faster and stops reading once `limit` entries
+                are found, but fields are raw element text: no HTML
+                sanitizing or date normalization. Falls back to feedparser
+                for malformed XML.
         """
         self.limit = limit
+        self.use_fast = use_fast
 
     def run(self, data: Any, context: dict[str, Any]) -> list[dict[str, Any]]:
         """Parse RSS/Atom feed."""
         xml_text = str(data)
 
-        logger.info(f"Parsing RSS/Atom feed ({len(xml_text)} chars)")
+        logger.info("Parsing RSS/Atom feed (%d chars)", len(xml_text))
+
+        if self.use_fast:
+            try:
+                feed_title, entries = self._parse_fast(xml_text)
+            except ParseError as e:
+                logger.warning("Fast feed parsing failed (%s), falling back to feedparser", e)
+            else:
+                context['feed_title'] = feed_title
+                context['entry_count'] = len(entries)
+                logger.info("Parsed %d entries from '%s'", len(entries), feed_title)
+                return entries
+
+        import feedparser
 
         feed = feedparser.parse(xml_text)
 
@@ -289,21 +495,86 @@ class ParseRSSStep:
         feed_title = feed.feed.get('title', 'Unknown Feed')
         context['feed_title'] = feed_title
 
-        # Extract entries
-        entries = []
-        for entry in feed.entries[:self.limit] if self.limit else feed.entries:
-            entries.append({
+        # Extract entries. The fallback keys are only looked up when the
+        # primary one is missing or empty.
+        entries = [
+            {
                 'title': entry.get('title', 'Untitled'),
                 'link': entry.get('link', ''),
-                'published': entry.get('published', entry.get('updated', '')),
-                'summary': entry.get('summary', entry.get('description', ''))[:200]
-            })
+                'published': entry.get('published') or entry.get('updated') or '',
+                'summary': (entry.get('summary') or entry.get('description') or '')[:200]
+            }
+            for entry in (feed.entries[:self.limit] if self.limit else feed.entries)
+        ]
 
         context['entry_count'] = len(entries)
 
-        logger.info(f"Parsed {len(entries)} entries from '{feed_title}'")
+        logger.info("Parsed %d entries from '%s'", len(entries), feed_title)
         return entries
 
+    def _parse_fast(self, xml_text: str) -> tuple[str, list[dict[str, Any]]]:
+        """Stream RSS/Atom items/entries, returning (feed_title, entries)."""
+        parser = XMLPullParser(events=('start', 'end'))
+        limit = self.limit
+        feed_title = None
+        entries: list[dict[str, Any]] = []
+        entry_depth = 0
+
+        def consume() -> bool:
+            """Handle pending parser events; True once enough entries are read."""
+            nonlocal feed_title, entry_depth
+            for event, elem in parser.read_events():
+                name = elem.tag.rpartition('}')[2]
+                if name in ('item', 'entry'):
+                    if event == 'start':
+                        entry_depth += 1
+                        continue
+                    entry_depth -= 1
+                    entries.append(self._fast_entry(elem))
+                    elem.clear()
+                    if limit and len(entries) >= limit:
+                        return True
+                elif event == 'end' and name == 'title' and not entry_depth and feed_title is None:
+                    feed_title = elem.text or ''
+            return False
+
+        chunk_size = 1 << 16
+        for start in range(0, len(xml_text), chunk_size):
+            parser.feed(xml_text[start:start + chunk_size])
+            if consume():
+                break
+        else:
+            parser.close()
+            consume()
+
+        return feed_title or 'Unknown Feed', entries
+
+    @staticmethod
+    def _fast_entry(elem: Any) -> dict[str, Any]:
+        """Build an entry dict from an <item>/<entry> element's children."""
+        fields: dict[str, str] = {}
+        link = None
+        for child in elem:
+            name = child.tag.rpartition('}')[2]
+            if name == 'link':
+                # Atom puts the URL in href; prefer the 'alternate' link
+                if link is None and child.get('rel', 'alternate') == 'alternate':
+                    link = child.get('href') or (child.text or '').strip()
+            elif name not in fields:
+                fields[name] = child.text or ''
+
+        published = next(
+            (fields[k] for k in ('published', 'pubDate', 'date', 'issued', 'updated', 'modified') if k in fields),
+            ''
+        )
+        summary = fields.get('summary', fields.get('description', ''))
+        return {
+            'title': fields.get('title', 'Untitled'),
+            'link': link or '',
+            'published': published,
+            'summary': summary[:200]
+        }
+
 
 @register_step("format_entries_markdown")
 class FormatEntriesMarkdownStep:
@@ -326,9 +597,9 @@ class FormatEntriesMarkdownStep:
 
     def run(self, data: Any, context: dict[str, Any]) -> str:
         """Format entries as markdown."""
-        entries = list(data)
+        entries = data if isinstance(data, list) else list(data)
 
-        logger.info(f"Formatting {len(entries)} entries as markdown")
+        logger.info("Formatting %d entries as markdown", len(entries))
 
         lines = []
         for i, entry in enumerate(entries, 1):
@@ -359,5 +630,5 @@ class FormatEntriesMarkdownStep:
 
         result = "\n".join(lines)
 
-        logger.info(f"Generated {len(result)} chars of markdown")
+        logger.info("Generated %d chars of markdown", len(result))
         return result
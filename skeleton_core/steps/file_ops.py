@@ -4,16 +4,21 @@ File operation steps for Bonesaw.
 Provides common file system operations like read, write, copy, move, delete.
 """
 
+import fnmatch
 import logging
-import shutil
+import os
+import re
 from pathlib import Path
 from typing import Any, Optional
 
 from skeleton_core.config import register_step
-from skeleton_core.utils import validate_file_path
+from skeleton_core.utils import read_text_file, validate_file_path
 
 logger = logging.getLogger(__name__)
 
+# Default write buffer; large payloads go out in few write() syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 @register_step("read_file")
 class ReadFileStep:
@@ -37,15 +42,14 @@ class ReadFileStep:
         file_path = self.path or data
         validated_path = validate_file_path(file_path)
 
-        logger.info(f"Reading file: {validated_path}")
+        logger.info("Reading file: %s", validated_path)
 
-        with open(validated_path, 'r', encoding='utf-8') as f:
-            contents = f.read()
+        contents = read_text_file(validated_path)
 
         context['file_size'] = len(contents)
         context['file_path'] = str(validated_path)
 
-        logger.info(f"Read {len(contents)} bytes from {validated_path}")
+        logger.info("Read %d bytes from %s", len(contents), validated_path)
         return contents
 
 
@@ -59,29 +63,37 @@ class WriteFileStep:
     Context: Writes 'bytes_written'
     """
 
-    def __init__(self, path: str, mode: str = 'w'):
+    def __init__(self, path: str, mode: str = 'w', buffer_size: int = WRITE_BUFFER_SIZE):
         """
         Args:
             path: Path to output file
             mode: Write mode ('w' for overwrite, 'a' for append)
+            buffer_size: Size in bytes of the write buffer
         """
         self.path = path
         self.mode = mode
+        self.buffer_size = buffer_size
 
     def run(self, data: Any, context: dict[str, Any]) -> str:
         """Write data to file."""
         output_path = Path(self.path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"Writing to file: {output_path} (mode={self.mode})")
+        logger.info("Writing to file: %s (mode=%s)", output_path, self.mode)
 
-        with open(output_path, self.mode, encoding='utf-8') as f:
-            f.write(str(data))
+        # Text modes ('w', 'a', 'wt', ...) keep newline translation; the larger
+        # buffer sits under the text layer. Binary modes get UTF-8 bytes.
+        if 'b' in self.mode:
+            with open(output_path, self.mode, buffering=self.buffer_size) as f:
+                f.write(str(data).encode('utf-8'))
+        else:
+            with open(output_path, self.mode, encoding='utf-8', buffering=self.buffer_size) as f:
+                f.write(str(data))
 
         bytes_written = output_path.stat().st_size
         context['bytes_written'] = bytes_written
 
-        logger.info(f"Wrote {bytes_written} bytes to {output_path}")
+        logger.info("Wrote %d bytes to %s", bytes_written, output_path)
         return str(output_path)
 
 
@@ -95,14 +107,23 @@ class CopyFileStep:
     Context: Writes 'source_path' and 'dest_path'
     """
 
-    def __init__(self, src: Optional[str] = None, dest: Optional[str] = None):
+    def __init__(
+        self,
+        src: Optional[str] = None,
+        dest: Optional[str] = None,
+        preserve_metadata: bool = True
+    ):
         """
         Args:
             src: Source file path (optional if passed via data)
             dest: Destination file path
+            preserve_metadata: Copy timestamps and permission bits too. When
+                False only the contents are copied, which skips the extra
+                stat/utime/chmod calls
         """
         self.src = src
         self.dest = dest
+        self.preserve_metadata = preserve_metadata
 
     def run(self, data: Any, context: dict[str, Any]) -> str:
         """Copy file."""
@@ -110,9 +131,18 @@ class CopyFileStep:
         dest_path = Path(self.dest)
         dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"Copying {src_path} -> {dest_path}")
+        logger.info("Copying %s -> %s", src_path, dest_path)
 
-        shutil.copy2(src_path, dest_path)
+        import shutil
+
+        # Both paths copy the contents with shutil.copyfile, which uses the
+        # platform's in-kernel copy (sendfile, fcopyfile) where available
+        if self.preserve_metadata:
+            shutil.copy2(src_path, dest_path)
+        else:
+            if dest_path.is_dir():
+                dest_path = dest_path / src_path.name
+            shutil.copyfile(src_path, dest_path)
 
         context['source_path'] = str(src_path)
         context['dest_path'] = str(dest_path)
@@ -146,7 +176,9 @@ class MoveFileStep:
         dest_path = Path(self.dest)
         dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"Moving {src_path} -> {dest_path}")
+        logger.info("Moving %s -> %s", src_path, dest_path)
+
+        import shutil
 
         shutil.move(src_path, dest_path)
 
@@ -178,7 +210,7 @@ class DeleteFileStep:
         """Delete file."""
         file_path = validate_file_path(self.path or data)
 
-        logger.info(f"Deleting file: {file_path}")
+        logger.info("Deleting file: %s", file_path)
 
         file_path.unlink()
 
@@ -211,16 +243,55 @@ class ListFilesStep:
         """List files matching pattern."""
         dir_path = Path(self.directory)
 
-        logger.info(f"Listing files in {dir_path} matching '{self.pattern}'")
-
-        if "**" in self.pattern:
-            files = list(dir_path.glob(self.pattern))
-        else:
-            files = list(dir_path.glob(self.pattern))
+        logger.info("Listing files in %s matching '%s'", dir_path, self.pattern)
 
-        file_paths = [str(f) for f in files if f.is_file()]
+        file_paths = self._scan(str(dir_path), self.pattern)
+        if file_paths is None:
+            file_paths = [str(f) for f in dir_path.glob(self.pattern) if f.is_file()]
 
         context['file_count'] = len(file_paths)
 
-        logger.info(f"Found {len(file_paths)} files")
+        logger.info("Found %d files", len(file_paths))
+        return file_paths
+
+    @staticmethod
+    def _scan(base: str, pattern: str) -> Optional[list[str]]:
+        """
+        List files for 'name-pattern' and '**/name-pattern' globs via scandir.
+
+        DirEntry.is_file() is answered from the directory listing on most
+        platforms, so this avoids the per-match stat that Path.glob + is_file
+        costs. Returns None for patterns it doesn't handle, and paths spelled
+        the way Path.glob would spell them.
+        """
+        recursive = pattern.startswith('**/')
+        name_pattern = pattern[3:] if recursive else pattern
+        if not name_pattern or '**' in name_pattern or '/' in name_pattern or os.sep in name_pattern:
+            return None
+
+        match = re.compile(fnmatch.translate(os.path.normcase(name_pattern))).match
+        # Path('.') / name is just name, so drop the './' that os.path.join adds
+        strip = len(base) + 1 if base == '.' else 0
+
+        file_paths: list[str] = []
+        pending = [base]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            file_paths.extend(
+                entry.path[strip:] for entry in entries
+                if match(os.path.normcase(entry.name)) and entry.is_file()
+            )
+
+            if recursive:
+                # Like the '**' glob: depth-first in listing order, without
+                # descending into symlinked directories
+                subdirs = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+                pending.extend(reversed(subdirs))
+
         return file_paths
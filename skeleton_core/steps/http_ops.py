@@ -5,15 +5,21 @@ Provides steps for making HTTP requests, downloading files, and calling APIs.
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import Any, Optional
 
-import requests
-
 from skeleton_core.config import register_step
+from skeleton_core.utils import get_http_session
+
+# All steps share one pooled keep-alive session; requests itself is only
+# imported when the first HTTP step runs
 
 logger = logging.getLogger(__name__)
 
+# Read size for streamed downloads
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
 
 @register_step("http_get")
 class HTTPGetStep:
@@ -42,7 +48,7 @@ class HTTPGetStep:
 
         logger.info(f"GET {url}")
 
-        response = requests.get(url, headers=self.headers, timeout=self.timeout)
+        response = get_http_session().get(url, headers=self.headers, timeout=self.timeout)
         response.raise_for_status()
 
         context['status_code'] = response.status_code
@@ -88,7 +94,7 @@ class HTTPPostStep:
 
         logger.info(f"POST {self.url}")
 
-        response = requests.post(
+        response = get_http_session().post(
             self.url,
             json=json_data,
             headers=self.headers,
@@ -107,53 +113,156 @@ class HTTPPostStep:
 @register_step("download_file")
 class DownloadFileStep:
     """
-    Download a file from a URL.
+    Download a file from a URL, or several URLs concurrently.
 
-    Input: str (URL) or None if URL provided
-    Output: str (path to downloaded file)
+    Input: str (URL), list[str] (URLs), or None if URL provided
+    Output: str (path to downloaded file), or list[str] for a list of URLs
     Context: Writes 'file_size', 'download_url', 'download_path'
+        (total size and lists of URLs/paths for a list of URLs)
     """
 
-    def __init__(self, url: Optional[str] = None, output_path: Optional[str] = None, timeout: int = 60):
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        output_path: Optional[str] = None,
+        timeout: int = 60,
+        max_workers: int = 8
+    ):
         """
         Args:
             url: URL to download (optional if passed via data)
-            output_path: Where to save file (optional, uses filename from URL)
+            output_path: Where to save file (optional, uses filename from URL).
+                For a list of URLs, the directory to save them in.
             timeout: Download timeout in seconds
+            max_workers: Concurrent downloads when given a list of URLs
         """
         self.url = url
         self.output_path = output_path
         self.timeout = timeout
+        self.max_workers = max_workers
 
-    def run(self, data: Any, context: dict[str, Any]) -> str:
+    def run(self, data: Any, context: dict[str, Any]) -> Any:
         """Download file."""
         url = self.url or data
 
+        if isinstance(url, (list, tuple)):
+            paths = self.download_many(
+                url,
+                self.output_path or '.',
+                max_workers=self.max_workers,
+                timeout=self.timeout
+            )
+            context['file_size'] = sum(os.path.getsize(path) for path in paths)
+            context['download_url'] = list(url)
+            context['download_path'] = paths
+            return paths
+
         # Determine output path
         if self.output_path:
             output_path = Path(self.output_path)
         else:
-            filename = url.split('/')[-1] or 'download'
-            output_path = Path(filename)
+            output_path = Path(self._filename(url))
+
+        file_size = self._fetch(url, output_path, self.timeout)
+        context['file_size'] = file_size
+        context['download_url'] = url
+        context['download_path'] = str(output_path)
+
+        return str(output_path)
+
+    @classmethod
+    def download_many(
+        cls,
+        urls: list[str],
+        out_dir: str,
+        max_workers: int = 8,
+        timeout: int = 60
+    ) -> list[str]:
+        """
+        Download several URLs into a directory concurrently.
 
+        Each worker streams its own response straight to its own file, so
+        while one download waits on the network the others keep reading and
+        writing. All workers share the pooled HTTP session.
+
+        Args:
+            urls: URLs to download
+            out_dir: Directory to save the files in
+            max_workers: Maximum concurrent downloads
+            timeout: Per-download timeout in seconds
+
+        Returns:
+            Paths of the downloaded files, in URL order
+
+        Raises:
+            requests.HTTPError: If any download fails
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Name files after the URL; repeated names get the URL's index as a
+        # prefix (again, if the prefixed name is also taken) so concurrent
+        # downloads never write the same file
+        seen: set[str] = set()
+        targets = []
+        for i, url in enumerate(urls):
+            name = cls._filename(url)
+            while name in seen:
+                name = f"{i}_{name}"
+            seen.add(name)
+            targets.append(Path(out_dir) / name)
+
+        if not targets:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(targets))) as executor:
+            list(executor.map(lambda job: cls._fetch(job[0], job[1], timeout), zip(urls, targets)))
+
+        return [str(target) for target in targets]
+
+    @staticmethod
+    def _filename(url: str) -> str:
+        """Pick a local file name from the last URL path segment."""
+        return url.split('/')[-1] or 'download'
+
+    @classmethod
+    def _fetch(cls, url: str, output_path: Path, timeout: int) -> int:
+        """Stream one URL to output_path and return the file size."""
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         logger.info(f"Downloading {url} -> {output_path}")
 
-        response = requests.get(url, timeout=self.timeout, stream=True)
-        response.raise_for_status()
+        import shutil
 
-        with open(output_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        # Closing the streamed response hands its connection back to the pool
+        with get_http_session().get(url, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
 
-        file_size = output_path.stat().st_size
-        context['file_size'] = file_size
-        context['download_url'] = url
-        context['download_path'] = str(output_path)
+            # Copy straight from the socket in 1 MiB reads; decode_content
+            # keeps gzip/deflate transfer encodings handled as iter_content did
+            response.raw.decode_content = True
+            with open(output_path, 'wb') as f:
+                cls._prepare_output(f.fileno())
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
 
+        file_size = output_path.stat().st_size
         logger.info(f"Downloaded {file_size} bytes to {output_path}")
-        return str(output_path)
+        return file_size
+
+    @staticmethod
+    def _prepare_output(fd: int) -> None:
+        """
+        Tell the kernel the file is about to be written sequentially.
+
+        The file is not preallocated: a truncated body should leave a
+        visibly short file, not a full-size one padded with zeros. The hint
+        is best-effort, so filesystems and file types that reject it
+        (FIFOs, some network mounts) are ignored.
+        """
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
 
 
 @register_step("webhook")
@@ -183,7 +292,7 @@ class WebhookStep:
 
         logger.info(f"Sending webhook to {self.url}")
 
-        response = requests.post(self.url, json=payload, timeout=self.timeout)
+        response = get_http_session().post(self.url, json=payload, timeout=self.timeout)
         response.raise_for_status()
 
         context['status_code'] = response.status_code
@@ -6,12 +6,41 @@ Provides steps for text manipulation like grep, replace, split, template.
 
 import logging
 import re
-from typing import Any
+from itertools import filterfalse
+from string import Formatter
+from typing import Any, Iterator, Optional
 
 from skeleton_core.config import register_step
 
+try:
+    import re2
+except ImportError:  # optional: linear-time matching for GrepStep
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
+# Characters that make a replace pattern more than a plain string
+_REGEX_META_RE = re.compile(r'[.^$*+?{}\[\]\\|()]')
+
+# Grep splits large text inputs into blocks of roughly this many characters
+GREP_BLOCK_CHARS = 1 << 20
+
+
+def _iter_line_blocks(text: str) -> Iterator[list[str]]:
+    """
+    Yield text.splitlines() a block at a time.
+
+    Each block ends just after a '\\n', so a '\\r\\n' pair is never cut
+    and the concatenated blocks equal text.splitlines() exactly.
+    """
+    start = 0
+    end_of_text = len(text)
+    while start < end_of_text:
+        cut = text.find('\n', start + GREP_BLOCK_CHARS)
+        end = end_of_text if cut == -1 else cut + 1
+        yield text[start:end].splitlines()
+        start = end
+
 
 @register_step("grep")
 class GrepStep:
@@ -23,38 +52,68 @@ class GrepStep:
     Context: Writes 'match_count', 'total_lines'
     """
 
-    def __init__(self, pattern: str, case_sensitive: bool = True, invert: bool = False):
+    def __init__(
+        self,
+        pattern: str,
+        case_sensitive: bool = True,
+        invert: bool = False,
+        use_re2: bool = False
+    ):
         """
         Args:
             pattern: Regex pattern to match
             case_sensitive: Whether matching is case-sensitive
             invert: If True, return non-matching lines
+            use_re2: Match with Google RE2 (the optional google-re2 package)
+                in guaranteed linear time. Patterns RE2 can't handle, such as
+                backreferences or lookaround, fall back to the re module.
         """
         self.pattern = pattern
         self.case_sensitive = case_sensitive
         self.invert = invert
+        self.use_re2 = use_re2
+        # Compiled once here; run() may be called many times on one instance
+        self._regex = self._compile(pattern, case_sensitive, use_re2)
+
+    @staticmethod
+    def _compile(pattern: str, case_sensitive: bool, use_re2: bool) -> Any:
+        """Compile with RE2 when requested and possible, otherwise with re."""
+        if use_re2:
+            if re2 is None:
+                logger.warning("use_re2 set but google-re2 is not installed; using the re module")
+            else:
+                options = re2.Options()
+                options.case_sensitive = case_sensitive
+                try:
+                    return re2.compile(pattern, options)
+                except re2.error as e:
+                    logger.info(f"RE2 can't compile '{pattern}' ({e}); using the re module")
+
+        return re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
 
     def run(self, data: Any, context: dict[str, Any]) -> list[str]:
         """Grep for pattern."""
-        # Convert input to lines
+        # Split text input a block at a time so only one block's lines are
+        # alive at once; only the matches are kept
         if isinstance(data, str):
-            lines = data.splitlines()
+            blocks = _iter_line_blocks(data)
+            logger.info(f"Grepping for '{self.pattern}' in {len(data)} chars")
         else:
-            lines = list(data)
-
-        flags = 0 if self.case_sensitive else re.IGNORECASE
-        regex = re.compile(self.pattern, flags)
-
-        logger.info(f"Grepping for '{self.pattern}' in {len(lines)} lines")
+            lines = data if isinstance(data, list) else list(data)
+            blocks = (lines,)
+            logger.info(f"Grepping for '{self.pattern}' in {len(lines)} lines")
 
+        # filter/filterfalse run the loop in C; a match object is always truthy
+        search = self._regex.search
+        keep = filterfalse if self.invert else filter
         matches = []
-        for line in lines:
-            is_match = regex.search(line) is not None
-            if is_match != self.invert:  # XOR logic for invert
-                matches.append(line)
+        total_lines = 0
+        for block in blocks:
+            total_lines += len(block)
+            matches.extend(keep(search, block))
 
         context['match_count'] = len(matches)
-        context['total_lines'] = len(lines)
+        context['total_lines'] = total_lines
 
         logger.info(f"Found {len(matches)} matches")
         return matches
@@ -80,6 +139,14 @@ class ReplaceStep:
         self.pattern = pattern
         self.replacement = replacement
         self.count = count
+        self._regex = re.compile(pattern)
+        # Plain-text pattern and replacement (no metacharacters, no group
+        # references) can use str.replace instead of the regex engine
+        self._is_literal = (
+            count >= 0
+            and not _REGEX_META_RE.search(pattern)
+            and '\\' not in replacement
+        )
 
     def run(self, data: Any, context: dict[str, Any]) -> str:
         """Replace pattern."""
@@ -87,12 +154,21 @@ class ReplaceStep:
 
         logger.info(f"Replacing '{self.pattern}' with '{self.replacement}'")
 
-        result, num_replacements = re.subn(
-            self.pattern,
-            self.replacement,
-            text,
-            count=self.count
-        )
+        if self._is_literal:
+            result = text.replace(self.pattern, self.replacement, self.count or -1)
+            growth = len(self.replacement) - len(self.pattern)
+            if growth:
+                num_replacements = (len(result) - len(text)) // growth
+            else:
+                num_replacements = text.count(self.pattern)
+                if self.count:
+                    num_replacements = min(num_replacements, self.count)
+        else:
+            result, num_replacements = self._regex.subn(
+                self.replacement,
+                text,
+                count=self.count
+            )
 
         context['replacement_count'] = num_replacements
 
@@ -118,17 +194,35 @@ class SplitLinesStep:
         """
         self.strip = strip
         self.skip_empty = skip_empty
+        # Pick the single-pass splitter for this flag combination once
+        if strip and skip_empty:
+            self._split = self._split_strip_skip_empty
+        elif strip:
+            self._split = self._split_strip
+        elif skip_empty:
+            self._split = self._split_skip_empty
+        else:
+            self._split = str.splitlines
+
+    @staticmethod
+    def _split_strip_skip_empty(text: str) -> list[str]:
+        """Split, strip and drop empty lines in one pass."""
+        return [line for line in map(str.strip, text.splitlines()) if line]
+
+    @staticmethod
+    def _split_strip(text: str) -> list[str]:
+        """Split and strip each line."""
+        return [line.strip() for line in text.splitlines()]
+
+    @staticmethod
+    def _split_skip_empty(text: str) -> list[str]:
+        """Split and drop empty lines."""
+        return [line for line in text.splitlines() if line]
 
     def run(self, data: Any, context: dict[str, Any]) -> list[str]:
         """Split into lines."""
         text = str(data)
-        lines = text.splitlines()
-
-        if self.strip:
-            lines = [line.strip() for line in lines]
-
-        if self.skip_empty:
-            lines = [line for line in lines if line]
+        lines = self._split(text)
 
         context['line_count'] = len(lines)
 
@@ -155,7 +249,7 @@ class JoinLinesStep:
 
     def run(self, data: Any, context: dict[str, Any]) -> str:
         """Join lines."""
-        lines = list(data)
+        lines = data if isinstance(data, (list, tuple)) else list(data)
         result = self.separator.join(lines)
 
         context['line_count'] = len(lines)
@@ -165,6 +259,21 @@ class JoinLinesStep:
         return result
 
 
+class _TemplateFields:
+    """Mapping for str.format_map: fields come from the input, 'context' from the pipeline."""
+
+    __slots__ = ('context', 'variables')
+
+    def __init__(self, variables: Any, context: dict[str, Any]):
+        self.variables = variables
+        self.context = context
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'context':
+            return self.context
+        return self.variables[key]
+
+
 @register_step("template")
 class TemplateStep:
     """
@@ -181,17 +290,56 @@ class TemplateStep:
             template: Template string with {variable} placeholders
         """
         self.template = template
+        self._fields = self._named_fields(template)
+
+    @staticmethod
+    def _named_fields(template: str) -> Optional[frozenset[str]]:
+        """
+        Return the template's field names if every field is a plain {name},
+        {name!r} or {name:spec}, otherwise None.
+
+        Anything else (indexing, attributes, positional or nested fields,
+        malformed templates) is left to str.format with a copied kwargs dict,
+        so errors and edge cases behave exactly as before.
+        """
+        try:
+            parts = list(Formatter().parse(template))
+        except ValueError:
+            return None
+
+        fields = set()
+        for _literal, field, spec, conversion in parts:
+            if field is None:
+                continue
+            if not field.isidentifier() or '{' in spec or conversion not in (None, 'r', 's', 'a'):
+                return None
+            fields.add(field)
+        return frozenset(fields)
 
     def run(self, data: Any, context: dict[str, Any]) -> str:
         """Render template."""
-        variables = dict(data) if isinstance(data, dict) else {'data': data}
+        fields = self._fields
+        if fields is None or (type(data) is not dict and isinstance(data, dict)):
+            variables = dict(data) if isinstance(data, dict) else {'data': data}
+
+            # Also make context available
+            variables['context'] = context
 
-        # Also make context available
-        variables['context'] = context
+            logger.info(f"Rendering template with {len(variables)} variables")
+
+            result = self.template.format(**variables)
+        else:
+            # Look fields up directly instead of copying data into a kwargs dict.
+            # Dict subclasses take the path above, since format_map would honour
+            # their __missing__ where the copied kwargs dict does not.
+            variables = data if isinstance(data, dict) else {'data': data}
 
-        logger.info(f"Rendering template with {len(variables)} variables")
+            logger.info(f"Rendering template with {len(variables) + ('context' not in variables)} variables")
 
-        result = self.template.format(**variables)
+            if 'context' in fields:
+                result = self.template.format_map(_TemplateFields(variables, context))
+            else:
+                result = self.template.format_map(variables)
 
         logger.info(f"Rendered {len(result)} chars")
         return result
@@ -202,13 +350,18 @@ class ToUppercaseStep:
     """
     Convert text to uppercase.
 
-    Input: str (text)
-    Output: str (uppercase text)
+    Input: str (text) or list[str] (lines)
+    Output: str (uppercase text), or list[str] for list input
     """
 
-    def run(self, data: Any, context: dict[str, Any]) -> str:
+    def run(self, data: Any, context: dict[str, Any]) -> Any:
         """Convert to uppercase."""
-        return str(data).upper()
+        if isinstance(data, list):
+            # Convert each line and keep the list, rather than uppercasing the list's repr
+            if all(type(line) is str for line in data):
+                return list(map(str.upper, data))
+            return [str(line).upper() for line in data]
+        return (data if isinstance(data, str) else str(data)).upper()
 
 
 @register_step("to_lowercase")
@@ -216,10 +369,15 @@ class ToLowercaseStep:
     """
     Convert text to lowercase.
 
-    Input: str (text)
-    Output: str (lowercase text)
+    Input: str (text) or list[str] (lines)
+    Output: str (lowercase text), or list[str] for list input
     """
 
-    def run(self, data: Any, context: dict[str, Any]) -> str:
+    def run(self, data: Any, context: dict[str, Any]) -> Any:
         """Convert to lowercase."""
-        return str(data).lower()
+        if isinstance(data, list):
+            # Convert each line and keep the list, rather than lowercasing the list's repr
+            if all(type(line) is str for line in data):
+                return list(map(str.lower, data))
+            return [str(line).lower() for line in data]
+        return (data if isinstance(data, str) else str(data)).lower()
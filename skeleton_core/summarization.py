@@ -11,15 +11,26 @@ import json
 import logging
 import os
 import textwrap
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional: faster parsing of LLM responses
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SummarizationConfig:
     """Configuration for summarization mode."""
     provider: Optional[str]
@@ -28,9 +39,27 @@ class SummarizationConfig:
     use_llm_flag: bool
 
 
+@lru_cache(maxsize=1)
+def _env_settings() -> tuple[Optional[str], Optional[str], Optional[str]]:
+    """Read the BONESAW_LLM_* provider, API key and model once per process."""
+    return (
+        os.getenv("BONESAW_LLM_PROVIDER") or None,
+        os.getenv("BONESAW_LLM_API_KEY") or None,
+        os.getenv("BONESAW_LLM_MODEL") or None,
+    )
+
+
+def _refresh_env() -> None:
+    """Forget the cached BONESAW_LLM_* settings, e.g. after a test changes them."""
+    _env_settings.cache_clear()
+
+
 def get_summarization_config(context: Optional[dict[str, Any]] = None) -> SummarizationConfig:
     """
     Determine summarization configuration from environment and context.
+
+    The environment is read on the first call and cached; only the context
+    flag is looked at each time.
     
     Args:
         context: Pipeline context dictionary (may contain 'use_llm' flag)
@@ -38,11 +67,8 @@ def get_summarization_config(context: Optional[dict[str, Any]] = None) -> Summar
     Returns:
         SummarizationConfig with provider, API key, model, and flag status
     """
-    ctx = context or {}
-    provider = os.getenv("BONESAW_LLM_PROVIDER") or None
-    api_key = os.getenv("BONESAW_LLM_API_KEY") or None
-    model = os.getenv("BONESAW_LLM_MODEL") or None
-    use_llm_flag = bool(ctx.get("use_llm"))
+    provider, api_key, model = _env_settings()
+    use_llm_flag = bool(context.get("use_llm")) if context else False
     
     return SummarizationConfig(
         provider=provider,
@@ -70,23 +96,26 @@ def template_log_summary(stats: dict[str, Any]) -> str:
     Build a deterministic, data-driven summary for logs based on aggregated stats.
     
     Args:
-        stats: Dictionary with 'total', 'by_level', and 'logs' keys
+        stats: Dictionary with 'total', 'by_level', and 'logs' keys, where
+            'logs' holds parallel 'timestamps', 'levels', and 'messages' lists
         
     Returns:
         Multi-line summary string
     """
     total = stats.get("total", 0)
     by_level: dict[str, int] = stats.get("by_level", {})
-    levels_sorted = sorted(by_level.items(), key=lambda kv: kv[1], reverse=True)
-    dominant_level = levels_sorted[0][0] if levels_sorted else "UNKNOWN"
-    sample_logs: list[dict[str, Any]] = stats.get("logs", [])[:3]
+    # max() keeps the first of equal counts, like the stable descending sort it replaces
+    dominant_level = max(by_level.items(), key=itemgetter(1), default=("UNKNOWN", 0))[0]
+    logs: dict[str, list[str]] = stats.get("logs", {})
+    sample_logs = zip(
+        logs.get("timestamps", [])[:3],
+        logs.get("levels", [])[:3],
+        logs.get("messages", [])[:3],
+    )
     
     sample_lines: list[str] = []
-    for entry in sample_logs:
-        ts = entry.get("timestamp", "?")
-        level = entry.get("level", "?")
-        msg = entry.get("message", "")[:120]
-        sample_lines.append(f"- [{level}] {ts}: {msg}")
+    for ts, level, msg in sample_logs:
+        sample_lines.append(f"- [{level}] {ts}: {msg[:120]}")
     
     summary_lines = [
         f"The system emitted {total} log entries across {len(by_level)} levels.",
@@ -120,11 +149,8 @@ def template_feed_summary(entries: list[dict[str, Any]]) -> str:
         return "No entries were found in the configured feeds."
     
     # Count entries by feed_title
-    counts: dict[str, int] = {}
-    for e in entries:
-        ft = e.get("feed_title") or "Unknown Feed"
-        counts[ft] = counts.get(ft, 0) + 1
-    top_feeds = sorted(counts.items(), key=lambda kv: kv[1], reverse=True)[:3]
+    counts = Counter(e.get("feed_title") or "Unknown Feed" for e in entries)
+    top_feeds = counts.most_common(3)
     
     # Sample entry titles
     sample = entries[:3]
@@ -148,6 +174,32 @@ def template_feed_summary(entries: list[dict[str, Any]]) -> str:
     return "\n".join(summary_lines)
 
 
+@lru_cache(maxsize=1)
+def _llm_session() -> requests.Session:
+    """
+    Return the keep-alive session used for LLM calls.
+
+    Separate from the HTTP steps' session because its retry policy differs.
+    Only responses that say the request was not processed (429 Too Many
+    Requests, 503 Service Unavailable) and connection failures are retried.
+    Read timeouts and 502/504 are not: the provider may already have run
+    (and billed) the completion. Retry-After is not honoured, and a failed
+    call falls back to the simulated summary anyway.
+    """
+    retry = Retry(
+        total=2,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=[429, 503],
+        allowed_methods=frozenset({"POST"}),
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    return session
+
+
 def _call_llm(provider: str, api_key: str, model: str, prompt: str) -> str:
     """
     Call an LLM provider to generate a summary.
@@ -173,7 +225,7 @@ def _call_llm(provider: str, api_key: str, model: str, prompt: str) -> str:
         try:
             logger.info("Calling OpenRouter with model=%s", model)
             
-            response = requests.post(
+            response = _llm_session().post(
                 "https://openrouter.ai/api/v1/chat/completions",
                 headers={
                     "Authorization": f"Bearer {api_key}",
@@ -197,8 +249,8 @@ def _call_llm(provider: str, api_key: str, model: str, prompt: str) -> str:
                 )
                 return _simulated_response(provider, model, prompt)
             
-            # Parse response
-            data = response.json()
+            # Parse the raw body; skips requests' text decoding step
+            data = orjson.loads(response.content) if orjson is not None else json.loads(response.content)
             
             # Extract content from OpenRouter response format
             if "choices" in data and len(data["choices"]) > 0:
@@ -232,6 +284,23 @@ def _call_llm(provider: str, api_key: str, model: str, prompt: str) -> str:
         return _simulated_response(provider, model, prompt)
 
 
+def _json_prefix(obj: Any, limit: int) -> str:
+    """
+    Return json.dumps(obj, default=str)[:limit] without encoding all of obj.
+
+    The pure-Python iterencode yields the same text as json.dumps piece by
+    piece, so encoding stops as soon as enough characters are available.
+    """
+    chunks = []
+    size = 0
+    for chunk in json.JSONEncoder(default=str).iterencode(obj):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return "".join(chunks)[:limit]
+
+
 def _simulated_response(provider: str, model: str, prompt: str) -> str:
     """
     Generate a simulated LLM response for fallback scenarios.
@@ -293,7 +362,7 @@ def summarize_logs(stats: dict[str, Any], context: Optional[dict[str, Any]] = No
     try:
         prompt = (
             f"You are summarizing system logs. Here are the aggregated stats as JSON:\n"
-            f"{json.dumps(stats, default=str)[:2000]}\n\n"
+            f"{_json_prefix(stats, 2000)}\n\n"
             f"Write a brief 2-3 sentence summary."
         )
         llm_text = _call_llm(
@@ -435,7 +504,7 @@ def summarize_feeds(entries: list[dict[str, Any]], context: Optional[dict[str, A
         sample_for_prompt = entries[:10]
         prompt = (
             f"You are summarizing RSS/Atom feed entries. Here is a JSON snippet of entries:\n"
-            f"{json.dumps(sample_for_prompt, default=str)[:2000]}\n\n"
+            f"{_json_prefix(sample_for_prompt, 2000)}\n\n"
             f"Write a brief 2-3 sentence overview."
         )
         llm_text = _call_llm(
@@ -448,3 +517,33 @@ def summarize_feeds(entries: list[dict[str, Any]], context: Optional[dict[str, A
     except Exception as exc:  # noqa: BLE001
         logger.warning("LLM summarization for feeds failed, falling back to template only: %s", exc)
         return base_summary
+
+
+def summarize_all(
+    batches: list[Any],
+    context: Optional[dict[str, Any]] = None,
+    summarizer: Callable[[Any, Optional[dict[str, Any]]], str] = summarize_logs,
+    max_workers: int = 8,
+) -> list[str]:
+    """
+    Summarize several batches, overlapping the LLM round trips.
+
+    Each LLM call blocks on the network for most of its duration, so with
+    LLM summaries enabled the batches are summarized on a thread pool that
+    matches the LLM session's connection pool. Without an LLM the template
+    summaries are computed inline.
+
+    Args:
+        batches: Inputs for the summarizer (log stats, text lines or feed entries)
+        context: Pipeline context shared by all batches (may contain 'use_llm' flag)
+        summarizer: summarize_logs, summarize_text or summarize_feeds
+        max_workers: Maximum number of concurrent LLM calls
+
+    Returns:
+        One summary per batch, in input order
+    """
+    if len(batches) < 2 or not llm_enabled(get_summarization_config(context)):
+        return [summarizer(batch, context) for batch in batches]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+        return list(executor.map(lambda batch: summarizer(batch, context), batches))
@@ -5,11 +5,19 @@ Provides common helper functions used across the framework.
 """
 
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Read buffer for read_text_file; larger than io.DEFAULT_BUFFER_SIZE (8 KiB)
+READ_BUFFER_SIZE = 128 * 1024
+
+# O_NOATIME skips the inode atime update on Linux; elsewhere it's a no-op
+_O_NOATIME = getattr(os, 'O_NOATIME', 0)
+
 
 def validate_file_path(path: str, must_exist: bool = True, base_dir: Optional[str] = None) -> Path:
     """
@@ -27,6 +35,7 @@ def validate_file_path(path: str, must_exist: bool = True, base_dir: Optional[st
         ValueError: If path is outside the allowed base directory
         FileNotFoundError: If must_exist=True and file doesn't exist
     """
+    # Resolved on every call: symlinks may have changed since the last one
     resolved = Path(path).resolve()
 
     # Check if path is within allowed base directory
@@ -46,3 +55,59 @@ def validate_file_path(path: str, must_exist: bool = True, base_dir: Optional[st
 
     logger.debug(f"Validated path: {path} -> {resolved}")
     return resolved
+
+
+def read_text_file(path: "str | Path", encoding: str = 'utf-8') -> str:
+    """
+    Read a whole text file without updating its access time where supported.
+
+    O_NOATIME is only permitted on files the process owns; for anything else
+    the open is retried with plain O_RDONLY.
+
+    Args:
+        path: File to read
+        encoding: Text encoding
+
+    Returns:
+        The file contents, with universal newlines like Path.read_text
+    """
+    # open() owns the descriptor from the opener, so it is closed even if
+    # building the text wrapper fails (e.g. an unknown encoding)
+    with open(path, 'r', encoding=encoding, buffering=READ_BUFFER_SIZE, opener=_open_noatime) as f:
+        return f.read()
+
+
+def _open_noatime(path: "str | Path", flags: int) -> int:
+    """open() opener that adds O_NOATIME, retrying without it if refused."""
+    try:
+        return os.open(path, flags | _O_NOATIME)
+    except PermissionError:
+        if not _O_NOATIME:
+            raise
+        return os.open(path, flags)
+
+
+@lru_cache(maxsize=None)
+def get_http_session() -> Any:
+    """
+    Return the process-wide requests.Session used by the HTTP steps and LLM calls.
+
+    Reusing one session keeps connections alive between calls, so repeated
+    requests to the same host skip the TCP and TLS handshakes. Connection
+    failures and 502/503/504 responses to idempotent requests are retried
+    with a short backoff. requests is imported on first call.
+
+    Returns:
+        Shared requests.Session
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
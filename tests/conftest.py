@@ -1,13 +1,78 @@
 """
 Pytest configuration for Bonesaw tests.
 
-Ensures the project root is on sys.path so imports work correctly.
+Ensures the project root is on sys.path so imports work correctly, and
+provides shared read-only fixtures.
 """
 
+import json
 import os
 import sys
 
+import pytest
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON decoding for output checks
+    orjson = None
+
 # Add project root to sys.path so imports like "apps.*" and "skeleton_core.*" work
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
+
+# RAM-backed filesystem used for tmp_path when available
+SHM_DIR = "/dev/shm"
+
+
+def pytest_configure(config):
+    """
+    Put pytest's temporary directories on tmpfs when the machine has one.
+
+    pytest still creates its usual numbered pytest-of-<user>/pytest-N
+    directories with their cleanup, only under /dev/shm instead of the
+    system temp dir. An explicit --basetemp, TMPDIR or PYTEST_DEBUG_TEMPROOT
+    takes precedence.
+    """
+    if config.option.basetemp or os.environ.get("TMPDIR") or os.environ.get("PYTEST_DEBUG_TEMPROOT"):
+        return
+    if os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK):
+        os.environ["PYTEST_DEBUG_TEMPROOT"] = SHM_DIR
+
+
+@pytest.fixture(scope="session")
+def sample_entries():
+    """Two normalized feed entries shared by the writer tests. Treat as read-only."""
+    return [
+        {
+            "feed_title": "Test Feed",
+            "entry_title": "Test Entry 1",
+            "link": "https://example.com/1",
+            "published": "2025-10-31",
+            "summary": "First spooky test entry."
+        },
+        {
+            "feed_title": "Test Feed",
+            "entry_title": "Test Entry 2",
+            "link": "https://example.com/2",
+            "published": "2025-11-01",
+            "summary": "Second spooky test entry."
+        }
+    ]
+
+
+@pytest.fixture(scope="session")
+def load_json():
+    """Return a function that parses a JSON file from its raw bytes, with orjson when installed."""
+    loads = orjson.loads if orjson is not None else json.loads
+
+    def _load_json(path):
+        return loads(path.read_bytes())
+
+    return _load_json
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
+    """One temporary directory for the whole session; tests must use unique file names."""
+    return tmp_path_factory.mktemp("feeds")
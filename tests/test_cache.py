@@ -0,0 +1,192 @@
+"""
+Tests for the step result cache.
+
+Tests cache key derivation and the cache_step decorator.
+"""
+
+import mmap
+import os
+from collections import OrderedDict
+from typing import Any
+
+import pytest
+
+from skeleton_core import cache
+from skeleton_core.cache import cache_step, flush_cache_writes, get_cache_key
+
+
+@pytest.fixture
+def cache_dir(monkeypatch, tmp_path):
+    """Point the cache at an empty temporary directory with an empty memo."""
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(cache, "_MEMO", OrderedDict())
+    yield tmp_path
+    flush_cache_writes()
+
+
+def test_get_cache_key_is_stable_and_distinct():
+    """Test that equal inputs share a key and different inputs don't."""
+    key = get_cache_key("Step", ("data",), {"a": 1, "b": 2})
+    
+    assert key == get_cache_key("Step", ("data",), {"b": 2, "a": 1})
+    assert key != get_cache_key("Step", ("other",), {"a": 1, "b": 2})
+    assert key != get_cache_key("Step", ("data",), {"a": 1, "b": 3})
+    assert key != get_cache_key("OtherStep", ("data",), {"a": 1, "b": 2})
+
+
+def test_get_cache_key_distinguishes_value_types():
+    """Test that values with the same text but different types get different keys."""
+    keys = {
+        get_cache_key("Step", (value,), {})
+        for value in (1, "1", 1.0, True, None, "None", (1,), [1], b"1")
+    }
+    
+    assert len(keys) == 9
+    assert get_cache_key("Step", ([{"a": 1}],), {}) == get_cache_key("Step", ([{"a": 1}],), {})
+
+
+def test_get_cache_key_hashes_buffers_by_content(tmp_path):
+    """Test that bytes-like data is keyed by its content, including mmaps."""
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"haunted bytes")
+    
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        mmap_key = get_cache_key("Step", (mapped,), {})
+    
+    assert mmap_key == get_cache_key("Step", (b"haunted bytes",), {})
+    assert mmap_key == get_cache_key("Step", (bytearray(b"haunted bytes"),), {})
+    assert mmap_key != get_cache_key("Step", ("haunted bytes",), {})
+    assert mmap_key != get_cache_key("Step", (b"haunted bytez",), {})
+
+
+def test_cache_step_reuses_result(cache_dir):
+    """Test that a cached step only runs once for the same input."""
+    calls = []
+    
+    @cache_step(ttl=60)
+    class CountingStep:
+        def __init__(self, factor: int):
+            self.factor = factor
+        
+        def run(self, data: Any, context: dict[str, Any]) -> Any:
+            calls.append(data)
+            return [data * self.factor]
+    
+    context = {}
+    assert CountingStep(3).run(2, context) == [6]
+    assert context["cache_hit"] is False
+    
+    context = {}
+    assert CountingStep(3).run(2, context) == [6]
+    assert context["cache_hit"] is True
+    
+    # Different init params must not share the cached result
+    assert CountingStep(4).run(2, {}) == [8]
+    assert calls == [2, 2]
+
+
+def test_cache_step_round_trips_buffers(cache_dir):
+    """Test that results holding large buffers survive the cache file round trip."""
+    @cache_step(ttl=60)
+    class BufferStep:
+        def run(self, data: Any, context: dict[str, Any]) -> Any:
+            return {"payload": bytearray(b"\x00bones" * 10_000), "label": data}
+    
+    first = BufferStep().run("crypt", {})
+    
+    context = {}
+    second = BufferStep().run("crypt", context)
+    
+    assert context["cache_hit"] is True
+    assert second == first
+
+
+def test_cache_step_memo_returns_fresh_copies(cache_dir):
+    """Test that in-memory hits skip the disk but never share mutable results."""
+    @cache_step(ttl=60)
+    class ListStep:
+        def run(self, data: Any, context: dict[str, Any]) -> Any:
+            return [data]
+    
+    first = ListStep().run("bone", {})
+    first.append("mutated downstream")
+    
+    # Remove the file: the next hit must come from the in-process memo
+    flush_cache_writes()
+    cache_files = list(cache_dir.glob("*/*.pkl"))
+    assert len(cache_files) == 1
+    assert len(cache_files[0].parent.name) == 2
+    cache_files[0].unlink()
+    
+    context = {}
+    assert ListStep().run("bone", context) == ["bone"]
+    assert context["cache_hit"] is True
+
+
+def test_cache_stats_and_clear(cache_dir):
+    """Test that cache_stats counts cache files and clear_cache removes them."""
+    @cache_step(ttl=60)
+    class EchoStep:
+        def run(self, data: Any, context: dict[str, Any]) -> Any:
+            return data
+    
+    for value in ("a", "b", "c"):
+        EchoStep().run(value, {})
+    (cache_dir / "notes.txt").write_text("not a cache file")
+    
+    stats = cache.cache_stats()
+    assert stats["file_count"] == 3
+    assert stats["oldest_age"] >= stats["newest_age"] >= 0
+    
+    cache.clear_cache(older_than=3600)
+    assert cache.cache_stats()["file_count"] == 3
+    
+    cache.clear_cache()
+    assert cache.cache_stats()["file_count"] == 0
+    assert (cache_dir / "notes.txt").exists()
+
+
+def test_enforce_cache_limit_evicts_least_recently_used(cache_dir):
+    """Test that enforce_cache_limit removes the least recently used files first."""
+    shard = cache_dir / "ab"
+    shard.mkdir()
+    for i, name in enumerate(["old", "middle", "new"]):
+        path = shard / f"{name}.pkl"
+        path.write_bytes(b"x" * 1024)
+        os.utime(path, (1_000_000 + i, 1_000_000 + i))
+    
+    # Room for two of the three files
+    evicted = cache.enforce_cache_limit(max_mb=2048 / 1024 / 1024)
+    
+    assert evicted == 1
+    assert sorted(p.name for p in shard.iterdir()) == ["middle.pkl", "new.pkl"]
+    assert cache.enforce_cache_limit(max_mb=1) == 0
+
+
+def test_cache_step_recomputes_corrupt_cache_file(cache_dir):
+    """Test that an unreadable cache file is discarded and the step re-runs."""
+    calls = []
+    
+    @cache_step(ttl=60)
+    class TombStep:
+        def run(self, data: Any, context: dict[str, Any]) -> Any:
+            calls.append(data)
+            return {"epitaph": data}
+    
+    TombStep().run("rip", {})
+    flush_cache_writes()
+    
+    (cache_file,) = cache_dir.glob("*/*.pkl")
+    cache_file.write_bytes(b"not a pickle")
+    cache._MEMO.clear()
+    
+    context = {}
+    assert TombStep().run("rip", context) == {"epitaph": "rip"}
+    assert context["cache_hit"] is False
+    assert calls == ["rip", "rip"]
+    
+    # The recomputed result replaced the corrupt file
+    flush_cache_writes()
+    cache._MEMO.clear()
+    assert TombStep().run("rip", {}) == {"epitaph": "rip"}
+    assert calls == ["rip", "rip"]
@@ -5,30 +5,35 @@ Tests JSON and markdown output generation (no network calls).
 """
 
 import json
+from types import SimpleNamespace
 
-from apps.graveyard_feed_reviver.pipelines import WriteJSONStep, WriteMarkdownStep
+import pytest
 
+from apps.graveyard_feed_reviver.pipelines import (
+    FetchFeedsStep,
+    NormalizeEntriesStep,
+    WriteJSONStep,
+    WriteMarkdownStep,
+)
 
-def test_write_json_step(tmp_path):
+
+def _rss(title: str, *entry_titles: str) -> bytes:
+    """Build a minimal RSS document for offline feed tests."""
+    items = "".join(
+        f"<item><title>{t}</title><link>https://example.com/{t}</link></item>"
+        for t in entry_titles
+    )
+    return (
+        f'<?xml version="1.0"?><rss version="2.0"><channel>'
+        f"<title>{title}</title>{items}</channel></rss>"
+    ).encode("utf-8")
+
+
+def test_write_json_step(sample_entries, shared_tmp, load_json):
     """Test that WriteJSONStep correctly writes entries to JSON file."""
-    entries = [
-        {
-            "feed_title": "Test Feed",
-            "entry_title": "Test Entry 1",
-            "link": "https://example.com/1",
-            "published": "2025-10-31",
-            "summary": "First spooky test entry."
-        },
-        {
-            "feed_title": "Test Feed",
-            "entry_title": "Test Entry 2",
-            "link": "https://example.com/2",
-            "published": "2025-11-01",
-            "summary": "Second spooky test entry."
-        }
-    ]
+    entries = sample_entries
     
-    json_path = tmp_path / "feeds.json"
+    json_path = shared_tmp / "write_json_step.json"
     step = WriteJSONStep(output_path=str(json_path))
     
     context = {}
@@ -41,8 +46,7 @@ def test_write_json_step(tmp_path):
     assert json_path.exists()
     
     # Load and verify JSON content
-    with open(json_path, 'r', encoding='utf-8') as f:
-        loaded = json.load(f)
+    loaded = load_json(json_path)
     
     assert len(loaded) == 2
     assert loaded[0]["entry_title"] == "Test Entry 1"
@@ -52,26 +56,11 @@ def test_write_json_step(tmp_path):
     assert context["json_path"] == str(json_path)
 
 
-def test_write_markdown_step(tmp_path):
+def test_write_markdown_step(sample_entries, shared_tmp):
     """Test that WriteMarkdownStep correctly writes entries to markdown file."""
-    entries = [
-        {
-            "feed_title": "Test Feed",
-            "entry_title": "Test Entry 1",
-            "link": "https://example.com/1",
-            "published": "2025-10-31",
-            "summary": "First spooky test entry."
-        },
-        {
-            "feed_title": "Test Feed",
-            "entry_title": "Test Entry 2",
-            "link": "https://example.com/2",
-            "published": "2025-11-01",
-            "summary": "Second spooky test entry."
-        }
-    ]
+    entries = sample_entries
     
-    md_path = tmp_path / "feeds.md"
+    md_path = shared_tmp / "write_markdown_step.md"
     step = WriteMarkdownStep(output_path=str(md_path))
     
     context = {}
@@ -104,8 +93,16 @@ def test_write_markdown_step(tmp_path):
     assert context["markdown_path"] == str(md_path)
 
 
-def test_write_json_with_unicode(tmp_path):
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_json_with_unicode(tmp_path, monkeypatch, use_orjson):
     """Test that WriteJSONStep handles Unicode characters (emoji) correctly."""
+    from apps.graveyard_feed_reviver import pipelines
+    
+    if not use_orjson:
+        monkeypatch.setattr(pipelines, "orjson", None)
+    elif pipelines.orjson is None:
+        pytest.skip("orjson not installed")
+    
     entries = [
         {
             "feed_title": "Spooky Feed 👻",
@@ -122,10 +119,216 @@ def test_write_json_with_unicode(tmp_path):
     context = {}
     step.run(entries, context)
     
+    # Both encoders write raw UTF-8 rather than \u escapes
+    raw = json_path.read_bytes()
+    assert "👻".encode("utf-8") in raw
+    
     # Load and verify Unicode is preserved
-    with open(json_path, 'r', encoding='utf-8') as f:
-        loaded = json.load(f)
+    loaded = json.loads(raw)
     
     assert loaded[0]["feed_title"] == "Spooky Feed 👻"
     assert loaded[0]["entry_title"] == "Halloween Special 🎃"
     assert "💀🦴" in loaded[0]["summary"]
+
+
+def test_write_json_without_orjson_matches(monkeypatch, tmp_path, load_json):
+    """Test that the stdlib fallback writes the same bytes as the orjson path."""
+    from apps.graveyard_feed_reviver import pipelines
+    
+    entries = [{"feed_title": "Crypt ☠️", "entry_title": "A", "link": "", "published": None, "summary": None}]
+    
+    fast_path = tmp_path / "fast.json"
+    WriteJSONStep(output_path=str(fast_path)).run(entries, {})
+    
+    monkeypatch.setattr(pipelines, "orjson", None)
+    slow_path = tmp_path / "slow.json"
+    WriteJSONStep(output_path=str(slow_path)).run(entries, {})
+    
+    assert slow_path.read_bytes() == fast_path.read_bytes()
+    assert load_json(slow_path) == entries
+
+
+@pytest.mark.parametrize("extra", [
+    {"score": float("nan")},
+    {"score": 1e20},
+    {"views": 2 ** 70},
+    {"by_year": {2025: "spooky"}},
+])
+def test_write_json_step_matches_stdlib_for_unusual_values(tmp_path, extra):
+    """Test that values orjson would encode differently or reject still match json.dumps."""
+    entries = [{"feed_title": "Crypt", "entry_title": "A", **extra}]
+    
+    json_path = tmp_path / "unusual.json"
+    WriteJSONStep(output_path=str(json_path)).run(entries, {})
+    
+    assert json_path.read_bytes() == json.dumps(entries, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def test_write_json_step_rejects_non_json_values_like_stdlib(tmp_path):
+    """Test that values json can't encode raise TypeError even when orjson could encode them."""
+    from datetime import datetime
+    
+    entries = [{"feed_title": "Crypt", "published": datetime(2025, 10, 31)}]
+    
+    with pytest.raises(TypeError):
+        WriteJSONStep(output_path=str(tmp_path / "datetime.json")).run(entries, {})
+
+
+def test_write_json_step_encodes_once(monkeypatch, tmp_path, load_json):
+    """Test that the stdlib fallback encodes the whole document in one dumps call."""
+    from apps.graveyard_feed_reviver import pipelines
+    
+    calls = []
+    real_dumps = json.dumps
+    
+    def spy_dumps(*args, **kwargs):
+        calls.append(args)
+        return real_dumps(*args, **kwargs)
+    
+    def no_dump(*args, **kwargs):
+        raise AssertionError("json.dump writes token by token; encode once instead")
+    
+    monkeypatch.setattr(pipelines, "orjson", None)
+    monkeypatch.setattr(json, "dump", no_dump)
+    monkeypatch.setattr(json, "dumps", spy_dumps)
+    
+    entries = [{"feed_title": "Crypt", "entry_title": f"E{i}"} for i in range(50)]
+    json_path = tmp_path / "feeds.json"
+    WriteJSONStep(output_path=str(json_path)).run(entries, {})
+    
+    assert len(calls) == 1
+    assert load_json(json_path) == entries
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_json_step_empty(tmp_path, monkeypatch, use_orjson):
+    """Test that an empty entry list is written as the same "[]" the encoders produce."""
+    from apps.graveyard_feed_reviver import pipelines
+    
+    if not use_orjson:
+        monkeypatch.setattr(pipelines, "orjson", None)
+    
+    json_path = tmp_path / "empty.json"
+    context = {}
+    result = WriteJSONStep(output_path=str(json_path)).run([], context)
+    
+    assert result == []
+    assert json_path.read_bytes() == json.dumps([], indent=2).encode("utf-8")
+    assert context["json_path"] == str(json_path)
+
+
+def test_fetch_feeds_step_keeps_url_order_and_skips_failures(monkeypatch):
+    """Test that FetchFeedsStep returns entries in URL order and skips failed feeds."""
+    documents = {
+        "https://a.example/rss": _rss("Feed A", "A1", "A2"),
+        "https://b.example/rss": _rss("Feed B", "B1"),
+    }
+    
+    def fake_download(self, session, url, cached=None):
+        if url not in documents:
+            raise ConnectionError("feed is dead")
+        return SimpleNamespace(status_code=200, content=documents[url], headers={})
+    
+    monkeypatch.setattr(FetchFeedsStep, "_download", fake_download)
+    
+    step = FetchFeedsStep(max_workers=4, use_cache=False)
+    context = {}
+    urls = ["https://b.example/rss", "https://dead.example/rss", "https://a.example/rss"]
+    result = step.run(urls, context)
+    
+    assert [e["entry_title"] for e in result] == ["B1", "A1", "A2"]
+    assert result[0]["feed_title"] == "Feed B"
+    assert context["feeds_fetched"] == 2
+    assert context["total_entries"] == 3
+
+
+def test_fetch_feeds_step_reuses_cache_when_not_modified(monkeypatch, tmp_path):
+    """Test that FetchFeedsStep serves cached entries when a feed answers 304."""
+    url = "https://a.example/rss"
+    seen_validators = []
+    
+    def fake_download(self, session, url, cached=None):
+        seen_validators.append(cached and cached["etag"])
+        if cached and cached["etag"] == '"v1"':
+            return SimpleNamespace(status_code=304, content=b"", headers={})
+        return SimpleNamespace(status_code=200, content=_rss("Feed A", "A1"), headers={"ETag": '"v1"'})
+    
+    monkeypatch.setattr(FetchFeedsStep, "_download", fake_download)
+    step = FetchFeedsStep(cache_dir=str(tmp_path))
+    
+    first_context = {}
+    first = step.run([url], first_context)
+    
+    second_context = {}
+    second = step.run([url], second_context)
+    
+    assert second == first
+    assert seen_validators == [None, '"v1"']
+    assert first_context["feed_cache_misses"] == 1
+    assert second_context["feed_cache_hits"] == 1
+
+
+def test_normalize_entries_step_fills_defaults():
+    """Test that NormalizeEntriesStep fills missing fields and passes well-formed entries through."""
+    step = NormalizeEntriesStep()
+    well_formed = [
+        {
+            "feed_title": "Test Feed",
+            "entry_title": "Test Entry 1",
+            "link": "https://example.com/1",
+            "published": None,
+            "summary": None
+        }
+    ]
+    
+    context = {}
+    assert step.run(well_formed, context) is well_formed
+    assert context["normalized_count"] == 1
+    
+    result = step.run([{"entry_title": "Lonely Entry"}], context)
+    
+    assert result == [
+        {
+            "feed_title": "Unknown Feed",
+            "entry_title": "Lonely Entry",
+            "link": "",
+            "published": None,
+            "summary": None
+        }
+    ]
+
+
+def test_normalize_entries_step_consumes_generators():
+    """Test that NormalizeEntriesStep accepts entries from a lazy iterable."""
+    step = NormalizeEntriesStep()
+    well_formed = {
+        "feed_title": "Test Feed",
+        "entry_title": "Streamed",
+        "link": "",
+        "published": None,
+        "summary": None
+    }
+    
+    context = {}
+    result = step.run((entry for entry in [well_formed, {"feed_title": "Test Feed"}]), context)
+    
+    assert result[0] is well_formed
+    assert result[1]["entry_title"] == "Untitled"
+    assert context["normalized_count"] == 2
+
+
+def test_write_markdown_step_groups_entries_by_feed(tmp_path):
+    """Test that WriteMarkdownStep emits one section per feed, in feed title order."""
+    entries = [
+        {"feed_title": "Zombie Feed", "entry_title": "Z1", "link": "", "published": None, "summary": None},
+        {"feed_title": "Ghost Feed", "entry_title": "G1", "link": "", "published": None, "summary": None},
+        {"feed_title": "Zombie Feed", "entry_title": "Z2", "link": "", "published": None, "summary": None},
+    ]
+    
+    md_path = tmp_path / "grouped.md"
+    WriteMarkdownStep(output_path=str(md_path)).run(entries, {})
+    content = md_path.read_text(encoding='utf-8')
+    
+    assert content.count("## 📡 Zombie Feed") == 1
+    assert content.index("Ghost Feed") < content.index("Zombie Feed")
+    assert content.index("Z1") < content.index("Z2")
@@ -4,6 +4,8 @@ Tests for core pipeline functionality.
 Tests the Pipeline class and configuration loading.
 """
 
+import os
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -48,6 +50,95 @@ def test_pipeline_with_empty_context():
     assert result == 6
 
 
+@pytest.mark.parametrize("level", ["INFO", "WARNING"])
+def test_pipeline_failure_names_the_step(level, caplog):
+    """Test that a failing step is reported by position and name, with or without INFO logging."""
+    caplog.set_level(level, logger="skeleton_core.pipeline")
+    pipeline = Pipeline([AddOneStep(), MultiplyByTwoStep()], name="test_failure")
+    
+    with pytest.raises(RuntimeError, match=r"failed at step 1/2 \(AddOneStep\)") as exc_info:
+        pipeline.run(initial_data="x")
+    
+    assert isinstance(exc_info.value.__cause__, TypeError)
+
+
+@pytest.mark.parametrize("value", [
+    {"x": float("nan"), "y": 1e20, "z": float("-inf")},
+    [0.1, -0.0, 1e-5, 1e15, 1e16, 123456.789, 5e-324],
+    {"name": "Crypt ☠️", "count": 3, "nested": [True, None, {"ratio": 2.5}]},
+])
+def test_to_json_step_matches_json_dumps(value):
+    """Test that ToJSONStep writes exactly what json.dumps does, with or without orjson."""
+    import json
+
+    from skeleton_core.steps.data_ops import ToJSONStep
+
+    context = {}
+    result = ToJSONStep().run(value, context)
+
+    assert result == json.dumps(value, indent=2, ensure_ascii=False)
+    assert context["output_size"] == len(result)
+
+
+def test_download_many_gives_every_url_its_own_file(tmp_path, monkeypatch):
+    """Test that download_many never maps two URLs to the same file."""
+    from skeleton_core.steps.http_ops import DownloadFileStep
+
+    fetched = []
+    monkeypatch.setattr(
+        DownloadFileStep, "_fetch",
+        classmethod(lambda cls, url, output_path, timeout: fetched.append((url, output_path)) or 0)
+    )
+
+    urls = ["https://x.example/2_a", "https://y.example/a", "https://z.example/a"]
+    paths = DownloadFileStep.download_many(urls, str(tmp_path))
+
+    assert len(set(paths)) == len(urls)
+    assert [Path(p).name for p in paths] == ["2_a", "a", "2_2_a"]
+    assert sorted(fetched) == sorted(zip(urls, map(Path, paths)))
+
+
+@pytest.mark.parametrize("mode", ["w", "wt", "wb"])
+def test_write_file_step_accepts_text_and_binary_modes(tmp_path, mode):
+    """Test that WriteFileStep writes UTF-8 in explicit text and binary modes, then appends."""
+    from skeleton_core.steps.file_ops import WriteFileStep
+
+    path = tmp_path / "out.txt"
+    WriteFileStep(str(path), mode=mode).run("Crypt ☠️\n", {})
+    context = {}
+    WriteFileStep(str(path), mode=mode.replace("w", "a")).run("more", context)
+
+    # Text modes translate the newline for the platform; binary modes don't
+    newline = "\n" if "b" in mode else os.linesep
+    assert path.read_bytes() == f"Crypt ☠️{newline}more".encode("utf-8")
+    assert context["bytes_written"] == path.stat().st_size
+
+
+@pytest.mark.parametrize("template", [
+    "Hello {name}, {count:>3} new {item!r}",
+    "{context[run]}: {name}",
+    "{context} / {name}",
+    "{{literal}} {name}",
+])
+def test_template_step_matches_str_format(template):
+    """Test that TemplateStep renders exactly what str.format does, with context available."""
+    from skeleton_core.steps.text_ops import TemplateStep
+
+    data = {"name": "Crypt", "count": 7, "item": "bone", "context": "shadowed"}
+    context = {"run": 1}
+
+    expected = template.format(**{**data, "context": context})
+    assert TemplateStep(template).run(data, context) == expected
+
+
+def test_template_step_treats_expressions_as_field_names():
+    """Test that code-like placeholders are looked up as names, never evaluated."""
+    from skeleton_core.steps.text_ops import TemplateStep
+
+    with pytest.raises(KeyError):
+        TemplateStep("{__import__('os').getcwd()}").run({}, {})
+
+
 def test_build_pipeline_with_unknown_step_type():
     """Test that building a pipeline with unknown step type raises ValueError."""
     bad_config = {
@@ -66,6 +157,26 @@ def test_build_pipeline_with_unknown_step_type():
     assert "this_step_does_not_exist" in str(exc_info.value)
 
 
+def test_build_pipeline_with_unexpected_step_param():
+    """Test that a param the step's constructor doesn't accept raises TypeError."""
+    import skeleton_core.steps  # noqa: F401
+    
+    bad_config = {
+        "pipeline": {
+            "name": "bad_params",
+            "steps": [
+                {"type": "read_file", "path": "x.txt", "bogus": 1}
+            ]
+        }
+    }
+    
+    with pytest.raises(TypeError) as exc_info:
+        build_pipeline_from_config(bad_config)
+    
+    assert "read_file" in str(exc_info.value)
+    assert "bogus" in str(exc_info.value)
+
+
 def test_build_pipeline_missing_steps_key():
     """Test that config without 'steps' key raises KeyError."""
     bad_config = {
@@ -78,3 +189,93 @@ def test_build_pipeline_missing_steps_key():
         build_pipeline_from_config(bad_config)
     
     assert "steps" in str(exc_info.value)
+
+
+def test_load_config_reuses_json_sidecar(tmp_path, monkeypatch):
+    """Test that an unchanged config is served from its JSON sidecar."""
+    from skeleton_core import cache, config
+
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "cache")
+    config_path = tmp_path / "config.yml"
+    config_path.write_text("pipeline:\n  name: cached\n  steps: []\n", encoding="utf-8")
+    
+    first = config.load_config(str(config_path))
+    assert list((tmp_path / "cache" / "configs").glob("*.json"))
+    
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("YAML should not be parsed again")
+    
+    monkeypatch.setattr("yaml.load", fail_parse)
+    assert config.load_config(str(config_path)) == first
+    
+    # Editing the file changes its size, which invalidates the sidecar
+    monkeypatch.undo()
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "cache")
+    config_path.write_text("pipeline:\n  name: edited\n  steps: []\n", encoding="utf-8")
+    assert config.load_config(str(config_path))["pipeline"]["name"] == "edited"
+
+
+def test_validate_file_path_follows_repointed_symlinks(tmp_path):
+    """Repeated validations re-resolve symlinks and re-check existence."""
+    from skeleton_core.utils import validate_file_path
+
+    base = tmp_path / "base"
+    base.mkdir()
+    inside = base / "data.txt"
+    inside.write_text("x", encoding="utf-8")
+    outside = tmp_path / "secret.txt"
+    outside.write_text("y", encoding="utf-8")
+    link = base / "link.txt"
+    link.symlink_to(inside)
+
+    assert validate_file_path(str(link), base_dir=str(base)) == inside
+
+    # Repoint the symlink outside the base directory
+    link.unlink()
+    link.symlink_to(outside)
+    with pytest.raises(ValueError):
+        validate_file_path(str(link), base_dir=str(base))
+    assert validate_file_path(str(link)) == outside
+
+    outside.unlink()
+    with pytest.raises(FileNotFoundError):
+        validate_file_path(str(link))
+
+
+def test_recreated_app_registers_its_steps_again(tmp_path, monkeypatch):
+    """Test that a deleted and recreated app can be imported again after unregistering."""
+    import importlib
+    import shutil
+    import sys
+
+    from skeleton_core.config import STEP_REGISTRY, unregister_module_steps
+    from skeleton_core.scaffold import generate_app_files
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    app_dir = tmp_path / "recreated_app"
+    module_name = "recreated_app.pipelines"
+
+    def forget():
+        unregister_module_steps(module_name)
+        sys.modules.pop(module_name, None)
+        sys.modules.pop("recreated_app", None)
+        importlib.invalidate_caches()
+
+    try:
+        generate_app_files("recreated_app", app_dir)
+        first = importlib.import_module(module_name)
+        assert STEP_REGISTRY["load_text"] is first.LoadTextStep
+
+        # Delete and recreate the app under the same name
+        shutil.rmtree(app_dir)
+        assert sorted(unregister_module_steps(module_name)) == [
+            "load_text", "text_llm_summary", "transform_text", "write_text_report",
+        ]
+        forget()
+        generate_app_files("recreated_app", app_dir)
+
+        second = importlib.import_module(module_name)
+        assert second is not first
+        assert STEP_REGISTRY["load_text"] is second.LoadTextStep
+    finally:
+        forget()